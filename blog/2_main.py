@@ -1,8 +1,8 @@
-import feedparser
 import requests
 import re
 import json
 from collections import Counter
+from src.feed import fetch_new_entries, entry_id, get_feed_index
 
 # ---------------- CONFIG ----------------
 RSS_FEED_URL = "https://www.dealnews.com/c142/Electronics/?rss=1"
@@ -15,13 +15,16 @@ APIFY_ACTOR_URL = (
 
 
 def fetch_latest_product():
-    feed = feedparser.parse(RSS_FEED_URL)
-    entry = feed.entries[0]
+    # Conditional GET; entries handled by an earlier run are skipped
+    entries = fetch_new_entries(RSS_FEED_URL)
+    if not entries:
+        return None
+    entry = entries[0]
 
     title = entry.title
     description = re.sub("<.*?>", "", entry.get("summary", ""))
 
-    return title, description
+    return entry_id(entry), title, description
 
 
 def extract_seed_keyword(title):
@@ -126,7 +129,11 @@ If you’re planning a purchase soon, now is a great time to act while availabil
 
 def main():
     print("\nFetching latest product from RSS...")
-    title, description = fetch_latest_product()
+    product = fetch_latest_product()
+    if product is None:
+        print("No new products since the last run.")
+        return
+    product_id, title, description = product
 
     print("Product:", title)
 
@@ -142,6 +149,7 @@ def main():
     blog = generate_blog(title, description, seo_keywords)
 
     print(blog)
+    get_feed_index().mark_seen([product_id])
 
 
 if __name__ == "__main__":
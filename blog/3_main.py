@@ -1,10 +1,10 @@
-import feedparser
 import requests
 import re
 import os
 import base64
 from datetime import datetime
 from dotenv import load_dotenv
+from src.feed import fetch_new_entries, entry_id, get_feed_index
 
 load_dotenv()
 
@@ -29,11 +29,16 @@ BLOG_PATH = "_posts"  # root of repo
 
 
 def fetch_latest_product():
-    feed = feedparser.parse(RSS_FEED_URL)
-    entry = feed.entries[0]
+    # Conditional GET; entries handled by an earlier run are skipped
+    entries = fetch_new_entries(RSS_FEED_URL)
+    if not entries:
+        return None
+    entry = entries[0]
+
     title = entry.title
     description = re.sub("<.*?>", "", entry.get("summary", ""))
-    return title, description
+
+    return entry_id(entry), title, description
 
 
 def normalize_seed_keyword(title):
@@ -166,7 +171,11 @@ date: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S +0000')}
 
 def main():
     print("\nFetching latest product...")
-    title, _ = fetch_latest_product()
+    product = fetch_latest_product()
+    if product is None:
+        print("No new products since the last run.")
+        return
+    product_id, title, _ = product
     print("Product:", title)
 
     seed = normalize_seed_keyword(title)
@@ -181,6 +190,7 @@ def main():
 
     print("\nPublishing blog...")
     url = publish_to_github(title, blog)
+    get_feed_index().mark_seen([product_id])
 
     print("\n✅ Blog published successfully!")
     print("🔗 Live URL:", url)
@@ -1,16 +1,101 @@
 """SEO Blog Automation - Entry Point"""
 
+import argparse
+import asyncio
+from src.config import BATCH_SIZE, BATCH_MAX_CONCURRENCY, DATAFORSEO_LOGIN, DATAFORSEO_PASSWORD, METRICS_PATH
 from src.workflow import create_workflow
+from src.batch import run_batch, arun_batch
+from src.nodes.seo import get_seo_cache
+from src.clients import aclose_async_clients
+from src.instrumentation import print_summary, export_jsonl
+from src.checkpoint import new_thread_id, thread_config, sqlite_checkpointer, async_sqlite_checkpointer
 
 
-def main():
-    print("=" * 60)
-    print("🚀 SEO Blog Automation - LangGraph Workflow")
-    print("=" * 60)
+def parse_args():
+    parser = argparse.ArgumentParser(description="SEO Blog Automation")
+    parser.add_argument(
+        "--batch",
+        type=int,
+        nargs="?",
+        const=BATCH_SIZE,
+        metavar="N",
+        help=f"process the first N feed entries instead of only the latest one (default N: {BATCH_SIZE})"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=BATCH_MAX_CONCURRENCY,
+        help=f"pipelines to run at once in batch mode (default: {BATCH_MAX_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="run the async nodes on a single event loop"
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="THREAD_ID",
+        help="continue a failed run from its last completed node"
+    )
+    args = parser.parse_args()
+    if args.resume and args.batch:
+        parser.error("--resume applies to single runs, not --batch")
+    return args
+
+
+def resume_input(snapshot, thread_id):
+    """Graph input for a run: {} starts it, None continues from the checkpoint"""
+    if thread_id is None:
+        return {}
+    if not snapshot.values:
+        raise SystemExit(f"❌ No checkpoint found for run {thread_id}")
+    print(f"⏩ Resuming run {thread_id} at: {', '.join(snapshot.next) or 'end'}")
+    return None
+
+
+def invoke(thread_id, config):
+    with sqlite_checkpointer() as checkpointer:
+        app = create_workflow(checkpointer=checkpointer)
+        snapshot = app.get_state(config)
+        if thread_id and not snapshot.next and snapshot.values:
+            print(f"✅ Run {thread_id} already completed")
+            return snapshot.values
+        return app.invoke(resume_input(snapshot, thread_id), config)
+
+
+async def ainvoke(thread_id, config):
+    try:
+        async with async_sqlite_checkpointer() as checkpointer:
+            app = create_workflow(use_async=True, checkpointer=checkpointer)
+            snapshot = await app.aget_state(config)
+            if thread_id and not snapshot.next and snapshot.values:
+                print(f"✅ Run {thread_id} already completed")
+                return snapshot.values
+            return await app.ainvoke(resume_input(snapshot, thread_id), config)
+    finally:
+        await aclose_async_clients()
+
+
+def run_single(use_async, resume=None):
+    # Every run is checkpointed under its own thread id
+    thread_id = resume or new_thread_id()
+    config = thread_config(thread_id)
+    print(f"🧵 Run id: {thread_id}")
     
-    # Create and run workflow
-    app = create_workflow()
-    result = app.invoke({})
+    try:
+        if use_async:
+            result = asyncio.run(ainvoke(resume, config))
+        else:
+            result = invoke(resume, config)
+    except Exception:
+        print("\n❌ Run failed. Completed steps are saved; continue with:")
+        print(f"   python main.py --resume {thread_id}{' --async' if use_async else ''}")
+        raise
+    
+    if not result or not result.get("product_title"):
+        print("\n✅ No new products since the last run, nothing to publish")
+        return
     
     # Print results
     print("\n" + "=" * 60)
@@ -22,5 +107,58 @@ def main():
     print("=" * 60)
 
 
+def run_many(limit, max_concurrency, use_async):
+    if use_async:
+        results = asyncio.run(arun_batch(limit=limit, max_concurrency=max_concurrency))
+    else:
+        results = run_batch(limit=limit, max_concurrency=max_concurrency)
+    succeeded = [r for r in results if r["status"] == "ok"]
+    
+    # Print results
+    print("\n" + "=" * 60)
+    print(f"✅ BATCH COMPLETE: {len(succeeded)}/{len(results)} published")
+    print("=" * 60)
+    for r in results:
+        if r["status"] == "ok":
+            print(f"🔗 {r['publish_url']}")
+        else:
+            print(f"❌ {r['product_title'][:50]}: {r['error'][:80]}")
+    print("=" * 60)
+
+
+def print_cache_stats():
+    if not (DATAFORSEO_LOGIN and DATAFORSEO_PASSWORD):
+        return
+    stats = get_seo_cache().stats()
+    print(
+        f"🗄️  DataForSEO cache: {stats['hits']} hits, {stats['misses']} misses "
+        f"({stats['entries']} entries stored)"
+    )
+
+
+def print_metrics():
+    print_summary()
+    export_jsonl(METRICS_PATH)
+    print(f"📈 Node metrics appended to {METRICS_PATH}")
+
+
+def main():
+    args = parse_args()
+    
+    print("=" * 60)
+    print("🚀 SEO Blog Automation - LangGraph Workflow")
+    print("=" * 60)
+    
+    try:
+        if args.batch:
+            run_many(args.batch, args.concurrency, args.use_async)
+        else:
+            run_single(args.use_async, args.resume)
+    finally:
+        # Failed runs too: that's when per-node timings matter most
+        print_cache_stats()
+        print_metrics()
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,94 @@
+"""Batch mode: run the workflow over many feed entries in one process"""
+
+import asyncio
+from src.config import BATCH_SIZE, BATCH_MAX_CONCURRENCY
+from src.nodes.scraper import fetch_entries, afetch_entries
+from src.clients import aclose_async_clients
+from src.git_publisher import BatchPublisher, get_publish_backend
+from src.feed import get_feed_index
+from src.workflow import create_workflow
+
+
+def _collect_results(entries: list, outputs: list) -> list:
+    results = []
+    for entry, output in zip(entries, outputs):
+        if isinstance(output, Exception):
+            results.append({
+                "product_id": entry["product_id"],
+                "product_title": entry["product_title"],
+                "status": "error",
+                "error": str(output),
+            })
+        else:
+            results.append({
+                "product_id": entry["product_id"],
+                "product_title": entry["product_title"],
+                "status": "ok",
+                "blog_title": output.get("blog_title"),
+                "seo_keywords": output.get("seo_keywords"),
+                "publish_url": output.get("publish_url"),
+            })
+    
+    return results
+
+
+def _batch_config(max_concurrency: int, publisher: BatchPublisher) -> dict:
+    # publish_blog queues posts on the publisher instead of committing one by one
+    return {"max_concurrency": max_concurrency, "configurable": {"publisher": publisher}}
+
+
+def _publish_queued(publisher: BatchPublisher, results: list) -> list:
+    """Commit every queued post at once; if that fails, no post was published"""
+    try:
+        publisher.flush()
+    except Exception as e:
+        print(f"Batch publish failed: {e}")
+        for result in results:
+            if result["status"] == "ok":
+                result.update(status="error", error=f"publish failed: {e}", publish_url=None)
+    
+    # Published entries are skipped by later runs; failed ones are retried
+    get_feed_index().mark_seen([r["product_id"] for r in results if r["status"] == "ok"])
+    return results
+
+
+def run_batch(limit: int = BATCH_SIZE, max_concurrency: int = BATCH_MAX_CONCURRENCY) -> list:
+    """Run one pipeline per feed entry and return a result per entry"""
+    entries = fetch_entries(limit=limit)
+    if not entries:
+        print("No new feed entries to process")
+        return []
+    
+    print(f"Processing {len(entries)} products (max {max_concurrency} at once)")
+    
+    publisher = BatchPublisher(get_publish_backend())
+    app = create_workflow()
+    outputs = app.batch(
+        entries,
+        config=_batch_config(max_concurrency, publisher),
+        return_exceptions=True
+    )
+    return _publish_queued(publisher, _collect_results(entries, outputs))
+
+
+async def arun_batch(limit: int = BATCH_SIZE, max_concurrency: int = BATCH_MAX_CONCURRENCY) -> list:
+    """Async run_batch: every pipeline shares one event loop instead of a thread"""
+    try:
+        entries = await afetch_entries(limit=limit)
+        if not entries:
+            print("No new feed entries to process")
+            return []
+        
+        print(f"Processing {len(entries)} products (max {max_concurrency} at once)")
+        
+        publisher = BatchPublisher(get_publish_backend())
+        app = create_workflow(use_async=True)
+        outputs = await app.abatch(
+            entries,
+            config=_batch_config(max_concurrency, publisher),
+            return_exceptions=True
+        )
+        results = _collect_results(entries, outputs)
+        return await asyncio.to_thread(_publish_queued, publisher, results)
+    finally:
+        await aclose_async_clients()
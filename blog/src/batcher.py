@@ -0,0 +1,105 @@
+"""Micro-batching: coalesce concurrent single-key lookups into one bulk call"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+
+
+class MicroBatcher:
+    """Thread-safe batcher for pipelines running on worker threads
+    
+    Keys submitted within `window` seconds of the first pending key (or until
+    `max_size` keys are pending) are resolved by a single `bulk_fn(keys)` call,
+    which must return a dict mapping each key to its value.
+    """
+    
+    def __init__(self, bulk_fn, window: float, max_size: int):
+        self.bulk_fn = bulk_fn
+        self.window = window
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._timer = None
+    
+    def submit(self, key) -> Future:
+        future = Future()
+        with self._lock:
+            self._pending.setdefault(key, []).append(future)
+            full = len(self._pending) >= self.max_size
+            if not full and self._timer is None:
+                self._timer = threading.Timer(self.window, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self._flush()
+        return future
+    
+    def get(self, key):
+        return self.submit(key).result()
+    
+    def _flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not pending:
+            return
+        
+        try:
+            results = self.bulk_fn(list(pending))
+        except Exception as e:
+            for futures in pending.values():
+                for future in futures:
+                    future.set_exception(e)
+            return
+        
+        for key, futures in pending.items():
+            for future in futures:
+                future.set_result(results.get(key))
+
+
+class AsyncMicroBatcher:
+    """MicroBatcher for pipelines sharing one event loop; `bulk_fn` is a coroutine"""
+    
+    def __init__(self, bulk_fn, window: float, max_size: int):
+        self.bulk_fn = bulk_fn
+        self.window = window
+        self.max_size = max_size
+        self._pending = {}
+        self._handle = None
+    
+    async def get(self, key):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+        
+        if len(self._pending) >= self.max_size:
+            self._schedule_flush(loop)
+        elif self._handle is None:
+            self._handle = loop.call_later(self.window, self._schedule_flush, loop)
+        
+        return await future
+    
+    def _schedule_flush(self, loop):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        pending, self._pending = self._pending, {}
+        if pending:
+            loop.create_task(self._flush(pending))
+    
+    async def _flush(self, pending):
+        try:
+            results = await self.bulk_fn(list(pending))
+        except Exception as e:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        
+        for key, futures in pending.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(results.get(key))
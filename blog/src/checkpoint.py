@@ -0,0 +1,32 @@
+"""SQLite checkpoints, so a failed run can resume from its last completed node"""
+
+import uuid
+from pathlib import Path
+from contextlib import contextmanager, asynccontextmanager
+from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from src.config import CHECKPOINT_PATH
+
+
+def new_thread_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def thread_config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+@contextmanager
+def sqlite_checkpointer(path: str = CHECKPOINT_PATH):
+    """SqliteSaver for create_workflow(checkpointer=...)"""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with SqliteSaver.from_conn_string(path) as saver:
+        yield saver
+
+
+@asynccontextmanager
+async def async_sqlite_checkpointer(path: str = CHECKPOINT_PATH):
+    """AsyncSqliteSaver for create_workflow(use_async=True, checkpointer=...)"""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    async with AsyncSqliteSaver.from_conn_string(path) as saver:
+        yield saver
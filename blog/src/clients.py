@@ -0,0 +1,51 @@
+"""Process-wide HTTP clients, so every pipeline reuses keep-alive connections"""
+
+import asyncio
+import threading
+import weakref
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from src.config import HTTP_POOL_SIZE
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+# httpx async clients are bound to the event loop that opened them
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_session(name: str) -> requests.Session:
+    """Shared requests.Session per service (e.g. "github", "dataforseo")"""
+    with _sessions_lock:
+        session = _sessions.get(name)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[name] = session
+        return session
+
+
+def get_async_client(name: str) -> httpx.AsyncClient:
+    """Shared httpx.AsyncClient per service on the running event loop"""
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(name)
+    if client is None:
+        client = httpx.AsyncClient(
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=HTTP_POOL_SIZE,
+                max_keepalive_connections=HTTP_POOL_SIZE
+            )
+        )
+        clients[name] = client
+    return client
+
+
+async def aclose_async_clients() -> None:
+    """Close the running loop's async clients; call before the loop ends"""
+    clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
@@ -13,18 +13,69 @@ SERPAPI_KEY = os.getenv("SERPAPI_KEY")
 DATAFORSEO_LOGIN = os.getenv("DATAFORSEO_LOGIN")
 DATAFORSEO_PASSWORD = os.getenv("DATAFORSEO_PASSWORD")
 
+# Seed keywords arriving within this window share one bulk API call (0 disables)
+DATAFORSEO_BATCH_WINDOW = float(os.getenv("DATAFORSEO_BATCH_WINDOW", "0.5"))  # seconds
+DATAFORSEO_MAX_TASKS = 100  # tasks per POST allowed by the API
+
+# DataForSEO response cache (repeat products cost no API calls)
+SEO_CACHE_PATH = os.getenv("SEO_CACHE_PATH", ".cache/dataforseo.sqlite")
+SEO_CACHE_TTL = int(os.getenv("SEO_CACHE_TTL", str(24 * 60 * 60)))  # seconds
+SEO_CACHE_MAX_ENTRIES = int(os.getenv("SEO_CACHE_MAX_ENTRIES", "5000"))
+
 # LLM Provider: "openai" or "groq"
 LLM_PROVIDER = os.getenv("LLM_PROVIDER", "openai")
 LLM_MODEL = os.getenv("LLM_MODEL", "gpt-4o-mini")
 
+# LLM response cache: "sqlite" (persistent), "memory" (this process only) or "none"
+LLM_CACHE = os.getenv("LLM_CACHE", "sqlite")
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".cache/llm.sqlite")
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "2000"))
+
+# normalize_keyword trusts the rule-based normalizer at or above this confidence (above 1 disables it)
+NORMALIZER_MIN_CONFIDENCE = float(os.getenv("NORMALIZER_MIN_CONFIDENCE", "0.8"))
+
+# Stream generate_blog and restart it as soon as the JSON breaks (streamed calls skip the LLM cache)
+BLOG_STREAMING = os.getenv("BLOG_STREAMING", "false").lower() == "true"
+BLOG_MAX_RETRIES = int(os.getenv("BLOG_MAX_RETRIES", "2"))
+
+# Keep-alive connections per service shared by all pipelines
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "20"))
+
 # RSS Feed
 RSS_FEED_URL = "https://www.dealnews.com/c142/Electronics/?rss=1"
 
+# Processed entry GUIDs and the feed's ETag/Last-Modified, so runs only see new products
+FEED_INDEX_PATH = os.getenv("FEED_INDEX_PATH", ".cache/feed_index.json")
+FEED_INDEX_MAX_SEEN = int(os.getenv("FEED_INDEX_MAX_SEEN", "1000"))
+
+# Per-node timing/token records, appended as JSON lines after every run
+METRICS_PATH = os.getenv("METRICS_PATH", ".cache/metrics.jsonl")
+
+# Single runs save a checkpoint after every node; `main.py --resume THREAD_ID` continues a failed run
+CHECKPOINT_PATH = os.getenv("CHECKPOINT_PATH", ".cache/checkpoints.sqlite")
+
+# Batch mode: feed entries per run and pipelines in flight at once
+BATCH_SIZE = int(os.getenv("BATCH_SIZE", "10"))
+BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", "4"))
+
 # GitHub
 GITHUB_USERNAME = "Jai-Keshav-Sharma"
 REPO_NAME = "seo-blog-automation"
 BRANCH = "main"
 BLOG_PATH = "_posts"
 
+# Batch publishing: "github" (Git Data API) or "local" (bare repo at LOCAL_REPO_PATH)
+PUBLISH_BACKEND = os.getenv("PUBLISH_BACKEND", "github")
+LOCAL_REPO_PATH = os.getenv("LOCAL_REPO_PATH", ".cache/site.git")
+
 # SerpAPI
-SERP_NUM_RESULTS = 3
\ No newline at end of file
+SERP_NUM_RESULTS = 3
+SERP_TIMEOUT = 15  # seconds
+
+# Research queries, issued in parallel: (section heading, query template, timeout)
+SERP_QUERIES = [
+    ("Reviews", "{product} review", SERP_TIMEOUT),
+    ("Specifications", "{product} specifications", SERP_TIMEOUT),
+    ("Price Comparison", "{product} price comparison", SERP_TIMEOUT),
+    ("Alternatives", "{product} alternatives", SERP_TIMEOUT),
+]
\ No newline at end of file
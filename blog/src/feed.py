@@ -0,0 +1,108 @@
+"""Incremental RSS: conditional GET and an index of already processed entries"""
+
+import os
+import json
+import threading
+import feedparser
+from functools import lru_cache
+from pathlib import Path
+from src.config import FEED_INDEX_PATH, FEED_INDEX_MAX_SEEN
+
+
+class FeedIndex:
+    """ETag/Last-Modified of the last fully processed feed plus processed entry GUIDs
+    
+    Stored as a small JSON file. Only the newest max_seen GUIDs are kept, which
+    is plenty for a feed that lists a few dozen entries at a time.
+    """
+    
+    def __init__(self, path: str, max_seen: int = 1000):
+        self.path = Path(path)
+        self.max_seen = max_seen
+        self._lock = threading.Lock()
+        
+        data = json.loads(self.path.read_text()) if self.path.exists() else {}
+        self.etag = data.get("etag")
+        self.modified = data.get("modified")
+        self._seen = dict.fromkeys(data.get("seen", []))
+    
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({
+            "etag": self.etag,
+            "modified": self.modified,
+            "seen": list(self._seen),
+        }))
+        os.replace(tmp, self.path)
+    
+    def is_seen(self, entry_id: str) -> bool:
+        return entry_id in self._seen
+    
+    def mark_seen(self, entry_ids: list) -> None:
+        with self._lock:
+            for entry_id in entry_ids:
+                self._seen.pop(entry_id, None)
+                self._seen[entry_id] = None
+            # Oldest GUIDs first, so trimming the front keeps the newest
+            for entry_id in list(self._seen)[:max(0, len(self._seen) - self.max_seen)]:
+                del self._seen[entry_id]
+            self._save()
+    
+    def set_validators(self, etag: str | None, modified: str | None) -> None:
+        with self._lock:
+            self.etag, self.modified = etag, modified
+            self._save()
+    
+    def request_headers(self) -> dict:
+        """Conditional GET headers for HTTP clients other than feedparser"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.modified:
+            headers["If-Modified-Since"] = self.modified
+        return headers
+
+
+@lru_cache(maxsize=None)
+def get_feed_index() -> FeedIndex:
+    """Process-wide feed index, loaded on first use"""
+    return FeedIndex(FEED_INDEX_PATH, max_seen=FEED_INDEX_MAX_SEEN)
+
+
+def entry_id(entry) -> str:
+    return entry.get("id") or entry.get("link") or entry.title
+
+
+def new_entries(feed, index: FeedIndex, etag: str | None, modified: str | None) -> list:
+    """Entries of a parsed feed that have not been processed yet
+    
+    The feed's validators are only stored once every entry has been processed,
+    so entries that failed (or were over the batch limit) come back next run.
+    After that, an unchanged feed costs one 304 response.
+    
+    A fetch that failed (no response, an error status, or nothing parseable)
+    raises instead of looking like a feed with nothing new, and leaves the
+    stored validators alone.
+    """
+    status = feed.get("status")
+    if status == 304:
+        print("Feed not modified since last run")
+        return []
+    
+    if status is None or status >= 400 or (feed.get("bozo") and not feed.entries):
+        reason = f"HTTP {status}" if status else feed.get("bozo_exception") or "no response"
+        raise RuntimeError(f"Fetching {feed.get('href') or 'the RSS feed'} failed: {reason}")
+    
+    entries = [entry for entry in feed.entries if not index.is_seen(entry_id(entry))]
+    if not entries and status == 200:
+        index.set_validators(etag, modified)
+    
+    return entries
+
+
+def fetch_new_entries(url: str, index: FeedIndex | None = None) -> list:
+    """Conditional GET of an RSS feed, returning only unprocessed entries"""
+    index = index or get_feed_index()
+    feed = feedparser.parse(url, etag=index.etag, modified=index.modified)
+    return new_entries(feed, index, feed.get("etag"), feed.get("modified"))
@@ -0,0 +1,208 @@
+"""Bulk publishing: many posts written as a single git commit"""
+
+import os
+import threading
+import subprocess
+from pathlib import Path
+from src.clients import get_session
+from src.config import (
+    GITHUB_TOKEN,
+    GITHUB_USERNAME,
+    REPO_NAME,
+    BRANCH,
+    PUBLISH_BACKEND,
+    LOCAL_REPO_PATH,
+)
+
+
+def _refuse_overwrite(files: dict, existing: set, branch: str) -> None:
+    """Raise if a new post would replace a file already on the branch"""
+    clashes = sorted(set(files) & existing)
+    if clashes:
+        raise RuntimeError(f"Refusing to overwrite existing files on {branch}: {', '.join(clashes)}")
+
+
+class GitHubBackend:
+    """Commits files through the GitHub Git Data API
+    
+    One commit costs six requests whatever the number of files: read the
+    branch ref, read its commit, list its tree, create a tree (file contents
+    go inline, so GitHub creates the blobs), create the commit, then move the
+    ref. The new tree is built on the old one, so a path that already exists
+    would be replaced; commit refuses instead.
+    """
+    
+    def __init__(self, token: str, owner: str, repo: str, branch: str, max_attempts: int = 3):
+        self.api = f"https://api.github.com/repos/{owner}/{repo}/git"
+        self.branch = branch
+        self.max_attempts = max_attempts
+        self.headers = {
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github+json"
+        }
+    
+    def _request(self, method: str, path: str, **kwargs) -> dict:
+        response = get_session("github").request(
+            method, f"{self.api}/{path}", headers=self.headers, timeout=60, **kwargs
+        )
+        if response.status_code not in (200, 201):
+            raise RuntimeError(f"GitHub {method} {path} failed {response.status_code}: {response.text}")
+        return response.json()
+    
+    def _head(self) -> tuple:
+        """(commit SHA, tree SHA) at the tip of the branch"""
+        head = self._request("GET", f"ref/heads/{self.branch}")["object"]["sha"]
+        return head, self._request("GET", f"commits/{head}")["tree"]["sha"]
+    
+    def _paths(self, tree: str) -> set:
+        entries = self._request("GET", f"trees/{tree}", params={"recursive": "1"})["tree"]
+        return {entry["path"] for entry in entries if entry["type"] == "blob"}
+    
+    def existing_paths(self) -> set:
+        """Every file path on the branch"""
+        return self._paths(self._head()[1])
+    
+    def commit(self, files: dict, message: str) -> str:
+        for attempt in range(1, self.max_attempts + 1):
+            head, base_tree = self._head()
+            _refuse_overwrite(files, self._paths(base_tree), self.branch)
+            
+            tree = self._request("POST", "trees", json={
+                "base_tree": base_tree,
+                "tree": [
+                    {"path": path, "mode": "100644", "type": "blob", "content": content}
+                    for path, content in files.items()
+                ]
+            })["sha"]
+            
+            commit = self._request("POST", "commits", json={
+                "message": message,
+                "tree": tree,
+                "parents": [head]
+            })["sha"]
+            
+            # Fast-forward only: if another publish moved the branch, rebuild on top of it
+            try:
+                self._request("PATCH", f"refs/heads/{self.branch}", json={"sha": commit, "force": False})
+                return commit
+            except RuntimeError as e:
+                if attempt == self.max_attempts:
+                    raise
+                print(f"Branch moved during publish, retrying ({attempt}/{self.max_attempts}): {e}")
+
+
+class LocalGitBackend:
+    """Commits files into a local bare repository, for tests and dry runs"""
+    
+    def __init__(self, path: str, branch: str):
+        self.path = Path(path)
+        self.branch = branch
+        if not self.path.exists():
+            subprocess.run(["git", "init", "--bare", "-q", str(self.path)], check=True)
+    
+    def _git(self, *args, env=None, stdin=None) -> str:
+        result = subprocess.run(
+            ["git", "--git-dir", str(self.path), *args],
+            input=stdin, env=env, capture_output=True, text=True, check=True
+        )
+        return result.stdout.strip()
+    
+    def _parent(self):
+        try:
+            return self._git("rev-parse", "--verify", "-q", f"refs/heads/{self.branch}")
+        except subprocess.CalledProcessError:
+            return None
+    
+    def _paths(self, commit: str) -> set:
+        return set(self._git("ls-tree", "-r", "--name-only", commit).splitlines())
+    
+    def existing_paths(self) -> set:
+        """Every file path on the branch"""
+        parent = self._parent()
+        return self._paths(parent) if parent else set()
+    
+    def commit(self, files: dict, message: str) -> str:
+        env = {
+            "GIT_AUTHOR_NAME": "SEO Blog Automation",
+            "GIT_AUTHOR_EMAIL": "blog-automation@localhost",
+            "GIT_COMMITTER_NAME": "SEO Blog Automation",
+            "GIT_COMMITTER_EMAIL": "blog-automation@localhost",
+            **os.environ,
+            "GIT_INDEX_FILE": str(self.path / "publish.index"),
+        }
+        ref = f"refs/heads/{self.branch}"
+        parent = self._parent()
+        
+        if parent:
+            _refuse_overwrite(files, self._paths(parent), self.branch)
+            self._git("read-tree", parent, env=env)
+        else:
+            self._git("read-tree", "--empty", env=env)
+        
+        for path, content in files.items():
+            blob = self._git("hash-object", "-w", "--stdin", stdin=content)
+            self._git("update-index", "--add", "--cacheinfo", f"100644,{blob},{path}", env=env)
+        
+        tree = self._git("write-tree", env=env)
+        parents = ["-p", parent] if parent else []
+        commit = self._git("commit-tree", tree, *parents, "-m", message, env=env)
+        self._git("update-ref", ref, commit, *([parent] if parent else []))
+        return commit
+
+
+def get_publish_backend():
+    """Backend selected by PUBLISH_BACKEND ("github" or "local")"""
+    if PUBLISH_BACKEND == "local":
+        return LocalGitBackend(LOCAL_REPO_PATH, BRANCH)
+    return GitHubBackend(GITHUB_TOKEN, GITHUB_USERNAME, REPO_NAME, BRANCH)
+
+
+class BatchPublisher:
+    """Collects posts from many pipelines and publishes them in one commit"""
+    
+    def __init__(self, backend):
+        self.backend = backend
+        self._lock = threading.Lock()
+        self._posts = {}
+        self._existing = None
+    
+    def add(self, filename: str, content: str, title: str) -> str:
+        """Queue a post; returns its filename, with a -2, -3... suffix if it is taken
+        
+        Taken means another queued post or a file already on the branch uses it.
+        """
+        base, ext = os.path.splitext(filename)
+        with self._lock:
+            # Listed once per batch, on the first post
+            if self._existing is None:
+                self._existing = self.backend.existing_paths()
+            unique, n = filename, 1
+            while unique in self._posts or unique in self._existing:
+                n += 1
+                unique = f"{base}-{n}{ext}"
+            if unique != filename:
+                print(f"⚠️  {filename} is already taken, queuing as {unique}")
+            self._posts[unique] = (content, title)
+        return unique
+    
+    def __len__(self):
+        return len(self._posts)
+    
+    def flush(self):
+        """Commit every queued post; returns the commit SHA, or None if empty"""
+        with self._lock:
+            posts, self._posts = self._posts, {}
+        if not posts:
+            return None
+        
+        titles = "\n".join(f"- {title}" for _, title in posts.values())
+        noun = "post" if len(posts) == 1 else "posts"
+        message = f"Add {len(posts)} blog {noun}\n\n{titles}"
+        files = {filename: content for filename, (content, _) in posts.items()}
+        
+        commit = self.backend.commit(files, message)
+        with self._lock:
+            if self._existing is not None:
+                self._existing |= set(files)
+        print(f"Published {len(posts)} posts in commit {commit[:7]}")
+        return commit
@@ -1,20 +1,51 @@
+from functools import lru_cache
+from langchain_core.caches import InMemoryCache
 from langchain_openai import ChatOpenAI
 from langchain_groq import ChatGroq
-from src.config import LLM_PROVIDER, LLM_MODEL, OPENAI_API_KEY, GROQ_API_KEY
+from src.cache import SQLiteLLMCache
+from src.instrumentation import TokenUsageHandler
+from src.config import (
+    LLM_PROVIDER,
+    LLM_MODEL,
+    OPENAI_API_KEY,
+    GROQ_API_KEY,
+    LLM_CACHE,
+    LLM_CACHE_PATH,
+    LLM_CACHE_MAX_ENTRIES,
+)
 
 
+@lru_cache(maxsize=None)
+def get_llm_cache():
+    """Returns the LLM response cache selected by LLM_CACHE ("sqlite", "memory" or "none")"""
+    if LLM_CACHE == "sqlite":
+        return SQLiteLLMCache(LLM_CACHE_PATH, max_entries=LLM_CACHE_MAX_ENTRIES)
+    if LLM_CACHE == "memory":
+        return InMemoryCache(maxsize=LLM_CACHE_MAX_ENTRIES)
+    return None
+
+
+@lru_cache(maxsize=None)
 def get_llm():
-    """Returns LLM based on provider config"""
+    """Returns LLM based on provider config
+    
+    The client is built once per process and shared by every node, so calls
+    reuse the provider's keep-alive connection pool.
+    """
     if LLM_PROVIDER == "groq":
         return ChatGroq(
             model="llama-3.3-70b-versatile",
             api_key=GROQ_API_KEY,
-            temperature=0
+            temperature=0,
+            cache=get_llm_cache(),
+            callbacks=[TokenUsageHandler()]
         )
     else:
         return ChatOpenAI(
             model=LLM_MODEL,
             api_key=OPENAI_API_KEY,
             temperature=0,
-            model_kwargs={"response_format": {"type": "json_object"}}
-        )
\ No newline at end of file
+            model_kwargs={"response_format": {"type": "json_object"}},
+            cache=get_llm_cache(),
+            callbacks=[TokenUsageHandler()]
+        )
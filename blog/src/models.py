@@ -1,10 +1,16 @@
-from typing import TypedDict
+from typing import Annotated, TypedDict
+
+
+def merge_keywords(current: list, update: list) -> list:
+    """Reducer for seo_keywords: ordered union, so branch writes add up"""
+    return list(dict.fromkeys((current or []) + (update or [])))
 
 
 class BlogState(TypedDict):
     """State schema for LangGraph workflow"""
     
     # From fetch_product
+    product_id: str  # feed entry GUID, marked processed once published
     product_title: str
     product_description: str
     
@@ -13,7 +19,7 @@ class BlogState(TypedDict):
     product_category: str
     
     # From fetch_seo_keywords / generate_keywords
-    seo_keywords: list
+    seo_keywords: Annotated[list, merge_keywords]
     
     # From search_product
     search_results: str
@@ -23,4 +29,4 @@ class BlogState(TypedDict):
     blog_content: str
     
     # From publish_blog
-    publish_url: str
\ No newline at end of file
+    publish_url: str
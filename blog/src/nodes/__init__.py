@@ -1,11 +1,11 @@
 """Workflow nodes"""
 
-from .scraper import fetch_product
-from .normalizer import normalize_keyword
-from .seo import fetch_seo_keywords, generate_keywords
-from .search import search_product
-from .generator import generate_blog
-from .publisher import publish_blog
+from .scraper import fetch_product, afetch_product
+from .normalizer import normalize_keyword, anormalize_keyword
+from .seo import fetch_seo_keywords, generate_keywords, afetch_seo_keywords, agenerate_keywords
+from .search import search_product, asearch_product
+from .generator import generate_blog, agenerate_blog
+from .publisher import publish_blog, apublish_blog
 
 __all__ = [
     "fetch_product",
@@ -15,4 +15,11 @@ __all__ = [
     "search_product",
     "generate_blog",
     "publish_blog",
-]
\ No newline at end of file
+    "afetch_product",
+    "anormalize_keyword",
+    "afetch_seo_keywords",
+    "agenerate_keywords",
+    "asearch_product",
+    "agenerate_blog",
+    "apublish_blog",
+]
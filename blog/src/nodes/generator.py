@@ -1,30 +1,34 @@
 import json
+from contextlib import closing, aclosing
 from langchain_core.messages import HumanMessage
 from src.models import BlogState
 from src.llm import get_llm
 from src.prompts import get_blog_generation_prompt
+from src.streaming import JSONPrefixValidator
+from src.config import BLOG_STREAMING, BLOG_MAX_RETRIES
+from src.instrumentation import record_retry
 
+# Streaming progress is printed every this many characters
+PROGRESS_EVERY = 400
 
-def generate_blog(state: BlogState) -> BlogState:
-    """Node 6: LLM writes 200-word blog with SEO keywords"""
-    print("\n[NODE 6] Generating blog with LLM...")
-    
-    llm = get_llm()
-    prompt = get_blog_generation_prompt(
+
+def _build_prompt(state: BlogState) -> str:
+    return get_blog_generation_prompt(
         state["product_title"],
         state["product_category"],
         state["product_description"],
         state["seo_keywords"],
         state["search_results"]
     )
-    
-    response = llm.invoke([HumanMessage(content=prompt)])
-    
+
+
+def _parse_blog(state: BlogState, content: str) -> dict:
+    """Parse the LLM JSON answer into a state update, with a stub post as fallback"""
     # Debug: print raw response
-    print(f"Raw LLM response: {response.content[:200]}...")
+    print(f"Raw LLM response: {content[:200]}...")
     
     try:
-        blog = json.loads(response.content)
+        blog = json.loads(content)
     except json.JSONDecodeError as e:
         print(f"JSON decode error: {e}")
         # Fallback blog
@@ -33,9 +37,104 @@ def generate_blog(state: BlogState) -> BlogState:
             "content": f"Discover the {state['product_title']}. {state['product_description'][:150]}"
         }
     
-    state["blog_title"] = blog["title"]
-    state["blog_content"] = blog["content"]
-    
     print(f"Blog title: {blog['title']}")
     print(f"Blog length: {len(blog['content'].split())} words")
-    return state
\ No newline at end of file
+    return {
+        "blog_title": blog["title"],
+        "blog_content": blog["content"],
+    }
+
+
+class _StreamCheck:
+    """Accumulates streamed chunks and validates them as JSON on the fly"""
+    
+    def __init__(self):
+        self.validator = JSONPrefixValidator()
+        self.content = ""
+    
+    def feed(self, chunk) -> bool:
+        text = chunk.content if isinstance(chunk.content, str) else ""
+        before = len(self.content) // PROGRESS_EVERY
+        self.content += text
+        if len(self.content) // PROGRESS_EVERY > before:
+            print(f"  ...{len(self.content)} chars streamed")
+        return self.validator.feed(text)
+    
+    def failure(self) -> str | None:
+        if self.validator.error:
+            return f"invalid JSON ({self.validator.error})"
+        if not self.validator.complete:
+            return "stream ended before the JSON was complete"
+        return None
+
+
+def _report_failure(attempt: int, reason: str) -> None:
+    if attempt <= BLOG_MAX_RETRIES:
+        record_retry()
+        print(f"Attempt {attempt}: {reason}, retrying")
+    else:
+        print(f"Attempt {attempt}: {reason}, giving up")
+
+
+def _stream_blog(state: BlogState) -> str:
+    llm = get_llm()
+    messages = [HumanMessage(content=_build_prompt(state))]
+    
+    for attempt in range(1, BLOG_MAX_RETRIES + 2):
+        check = _StreamCheck()
+        # closing() stops the request as soon as the JSON breaks
+        with closing(llm.stream(messages)) as stream:
+            for chunk in stream:
+                if not check.feed(chunk):
+                    break
+        
+        reason = check.failure()
+        if reason is None:
+            return check.content
+        _report_failure(attempt, reason)
+    
+    return check.content
+
+
+async def _astream_blog(state: BlogState) -> str:
+    llm = get_llm()
+    messages = [HumanMessage(content=_build_prompt(state))]
+    
+    for attempt in range(1, BLOG_MAX_RETRIES + 2):
+        check = _StreamCheck()
+        # aclosing() stops the request as soon as the JSON breaks
+        async with aclosing(llm.astream(messages)) as stream:
+            async for chunk in stream:
+                if not check.feed(chunk):
+                    break
+        
+        reason = check.failure()
+        if reason is None:
+            return check.content
+        _report_failure(attempt, reason)
+    
+    return check.content
+
+
+def generate_blog(state: BlogState) -> dict:
+    """Node 6: LLM writes 200-word blog with SEO keywords"""
+    print("\n[NODE 6] Generating blog with LLM...")
+    
+    if BLOG_STREAMING:
+        return _parse_blog(state, _stream_blog(state))
+    
+    llm = get_llm()
+    response = llm.invoke([HumanMessage(content=_build_prompt(state))])
+    return _parse_blog(state, response.content)
+
+
+async def agenerate_blog(state: BlogState) -> dict:
+    """Node 6 (async): LLM writes 200-word blog with SEO keywords"""
+    print("\n[NODE 6] Generating blog with LLM...")
+    
+    if BLOG_STREAMING:
+        return _parse_blog(state, await _astream_blog(state))
+    
+    llm = get_llm()
+    response = await llm.ainvoke([HumanMessage(content=_build_prompt(state))])
+    return _parse_blog(state, response.content)
@@ -3,33 +3,72 @@ from langchain_core.messages import HumanMessage
 from src.models import BlogState
 from src.llm import get_llm
 from src.prompts import get_normalize_prompt
+from src.rules import normalize_title
+from src.config import NORMALIZER_MIN_CONFIDENCE
 
 
-def normalize_keyword(state: BlogState) -> BlogState:
-    """Node 2: LLM extracts core product name + category"""
-    print("\n[NODE 2] Normalizing keyword with LLM...")
-    
-    llm = get_llm()
-    prompt = get_normalize_prompt(state["product_title"])
-    
-    response = llm.invoke([HumanMessage(content=prompt)])
-    
+def _parse_normalized(state: BlogState, content: str) -> dict:
+    """Parse the LLM JSON answer into a state update, with a manual fallback"""
     # Debug: print raw response
-    print(f"Raw LLM response: {response.content}")
+    print(f"Raw LLM response: {content}")
     
     try:
-        result = json.loads(response.content)
+        result = json.loads(content)
     except json.JSONDecodeError as e:
         print(f"JSON decode error: {e}")
-        print(f"Response content: {response.content}")
+        print(f"Response content: {content}")
         # Fallback: extract manually
         result = {
             "name": state["product_title"].lower().split()[0],
             "category": "electronics"
         }
     
-    state["normalized_name"] = result["name"]
-    state["product_category"] = result["category"]
-    
     print(f"Normalized: {result['name']} ({result['category']})")
-    return state
\ No newline at end of file
+    return {
+        "normalized_name": result["name"],
+        "product_category": result["category"],
+    }
+
+
+def _normalize_with_rules(state: BlogState) -> dict | None:
+    """Rule-based fast path; None when the rules aren't confident enough"""
+    result = normalize_title(state["product_title"])
+    if result["confidence"] < NORMALIZER_MIN_CONFIDENCE:
+        print(f"Rule confidence {result['confidence']:.2f}, asking LLM")
+        return None
+    
+    print(f"Normalized by rules: {result['name']} ({result['category']})")
+    return {
+        "normalized_name": result["name"],
+        "product_category": result["category"],
+    }
+
+
+def normalize_keyword(state: BlogState) -> dict:
+    """Node 2: Rules or LLM extract core product name + category"""
+    print("\n[NODE 2] Normalizing keyword...")
+    
+    update = _normalize_with_rules(state)
+    if update:
+        return update
+    
+    llm = get_llm()
+    prompt = get_normalize_prompt(state["product_title"])
+    
+    response = llm.invoke([HumanMessage(content=prompt)])
+    return _parse_normalized(state, response.content)
+
+
+async def anormalize_keyword(state: BlogState) -> dict:
+    """Node 2 (async): Rules or LLM extract core product name + category"""
+    print("\n[NODE 2] Normalizing keyword...")
+    
+    update = _normalize_with_rules(state)
+    if update:
+        return update
+    
+    llm = get_llm()
+    prompt = get_normalize_prompt(state["product_title"])
+    
+    response = await llm.ainvoke([HumanMessage(content=prompt)])
+    return _parse_normalized(state, response.content)
@@ -1,8 +1,11 @@
 import re
 import base64
-import requests
 from datetime import datetime
+from pathlib import Path
+from langchain_core.runnables import RunnableConfig
 from src.models import BlogState
+from src.clients import get_session, get_async_client
+from src.feed import get_feed_index
 from src.config import GITHUB_TOKEN, GITHUB_USERNAME, REPO_NAME, BRANCH, BLOG_PATH
 
 
@@ -16,12 +19,17 @@ def slugify(text: str) -> str:
     return text.strip("-")[:60]
 
 
-def publish_blog(state: BlogState) -> BlogState:
-    """Node 7: Publish to GitHub Pages"""
-    print("\n[NODE 7] Publishing to GitHub...")
-    
+def post_url(filename: str) -> str:
+    """Live URL Jekyll gives a post file: <date>-<slug>.md -> /<year>/<month>/<day>/<slug>/"""
+    year, month, day, slug = Path(filename).stem.split("-", 3)
+    return f"https://{GITHUB_USERNAME}.github.io/{REPO_NAME}/{year}/{month}/{day}/{slug}/"
+
+
+def build_post(state: BlogState) -> tuple:
+    """Render the Jekyll post: returns (repo file path, markdown, live URL)"""
     date_prefix = datetime.utcnow().strftime("%Y-%m-%d")
-    filename = f"{BLOG_PATH}/{date_prefix}-{slugify(state['blog_title'])}.md"
+    slug = slugify(state['blog_title'])
+    filename = f"{BLOG_PATH}/{date_prefix}-{slug}.md"
     
     content = f"""---
 title: "{state['blog_title']}"
@@ -31,31 +39,82 @@ date: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S +0000')}
 {state['blog_content']}
 """
     
+    return filename, content, post_url(filename)
+
+
+def _contents_request(state: BlogState, filename: str, content: str) -> dict:
+    """Arguments for a PUT to the GitHub contents API"""
     encoded = base64.b64encode(content.encode()).decode()
     
-    url = f"https://api.github.com/repos/{GITHUB_USERNAME}/{REPO_NAME}/contents/{filename}"
-    
-    response = requests.put(
-        url,
-        headers={
+    return {
+        "url": f"https://api.github.com/repos/{GITHUB_USERNAME}/{REPO_NAME}/contents/{filename}",
+        "headers": {
             "Authorization": f"token {GITHUB_TOKEN}",
             "Accept": "application/vnd.github+json"
         },
-        json={
+        "json": {
             "message": f"Add blog post: {state['blog_title']}",
             "content": encoded,
             "branch": BRANCH
         }
-    )
+    }
+
+
+def _mark_processed(state: BlogState) -> None:
+    # Published entries are skipped by later runs
+    if state.get("product_id"):
+        get_feed_index().mark_seen([state["product_id"]])
+
+
+def _queue_post(state: BlogState, config) -> str | None:
+    """Hand the post to the run's BatchPublisher, if there is one"""
+    publisher = (config or {}).get("configurable", {}).get("publisher")
+    if publisher is None:
+        return None
+    
+    filename, content, _ = build_post(state)
+    # Two posts with the same date and slug get distinct files, and so distinct URLs
+    filename = publisher.add(filename, content, state["blog_title"])
+    print(f"Queued for batch commit: {filename}")
+    return post_url(filename)
+
+
+def publish_blog(state: BlogState, config: RunnableConfig = None) -> dict:
+    """Node 7: Publish to GitHub Pages"""
+    print("\n[NODE 7] Publishing to GitHub...")
+    
+    publish_url = _queue_post(state, config)
+    if publish_url:
+        return {"publish_url": publish_url}
+    
+    filename, content, publish_url = build_post(state)
+    
+    response = get_session("github").put(**_contents_request(state, filename, content))
     
     if response.status_code not in (200, 201):
         raise RuntimeError(response.text)
     
-    slug = slugify(state['blog_title'])
-    year, month, day = date_prefix.split("-")
+    print(f"Published: {publish_url}")
+    _mark_processed(state)
+    return {"publish_url": publish_url}
+
+
+async def apublish_blog(state: BlogState, config: RunnableConfig = None) -> dict:
+    """Node 7 (async): Publish to GitHub Pages"""
+    print("\n[NODE 7] Publishing to GitHub...")
+    
+    publish_url = _queue_post(state, config)
+    if publish_url:
+        return {"publish_url": publish_url}
+    
+    filename, content, publish_url = build_post(state)
     
-    publish_url = f"https://{GITHUB_USERNAME}.github.io/{REPO_NAME}/{year}/{month}/{day}/{slug}/"
-    state["publish_url"] = publish_url
+    client = get_async_client("github")
+    response = await client.put(**_contents_request(state, filename, content), timeout=60)
+    
+    if response.status_code not in (200, 201):
+        raise RuntimeError(response.text)
     
     print(f"Published: {publish_url}")
-    return state
\ No newline at end of file
+    _mark_processed(state)
+    return {"publish_url": publish_url}
@@ -2,19 +2,76 @@ import feedparser
 import re
 from src.config import RSS_FEED_URL
 from src.models import BlogState
+from src.clients import get_async_client
+from src.feed import get_feed_index, entry_id, new_entries, fetch_new_entries
 
 
-def fetch_product(state: BlogState) -> BlogState:
+def _feed_entries(entries: list, limit: int | None = None) -> list:
+    """Turn feed entries into initial workflow states"""
+    entries = entries if limit is None else entries[:limit]
+    
+    return [
+        {
+            "product_id": entry_id(entry),
+            "product_title": entry.title,
+            "product_description": re.sub("<.*?>", "", entry.get("summary", "")),
+        }
+        for entry in entries
+    ]
+
+
+def fetch_entries(limit: int | None = None) -> list:
+    """Fetch new products from the RSS feed as initial workflow states"""
+    return _feed_entries(fetch_new_entries(RSS_FEED_URL), limit)
+
+
+async def afetch_entries(limit: int | None = None) -> list:
+    """Fetch new products from the RSS feed as initial workflow states (async)"""
+    index = get_feed_index()
+    response = await get_async_client("rss").get(
+        RSS_FEED_URL, headers=index.request_headers(), timeout=30
+    )
+    
+    feed = feedparser.parse(response.content)
+    feed["status"] = response.status_code
+    feed["href"] = str(response.url)
+    entries = new_entries(
+        feed, index, response.headers.get("etag"), response.headers.get("last-modified")
+    )
+    return _feed_entries(entries, limit)
+
+
+def fetch_product(state: BlogState) -> dict:
     """Node 1: Fetch latest product from RSS feed"""
+    # Batch runs seed each pipeline with its own feed entry
+    if state.get("product_title"):
+        print(f"\n[NODE 1] Using queued product: {state['product_title']}")
+        return {}
+    
     print("\n[NODE 1] Fetching latest product...")
     
-    feed = feedparser.parse(RSS_FEED_URL)
-    entry = feed.entries[0]
-    title = entry.title
-    description = re.sub("<.*?>", "", entry.get("summary", ""))
+    entries = fetch_entries(limit=1)
+    if not entries:
+        print("No new products in feed")
+        return {}
+    
+    print(f"Product: {entries[0]['product_title']}")
+    return entries[0]
+
+
+async def afetch_product(state: BlogState) -> dict:
+    """Node 1 (async): Fetch latest product from RSS feed"""
+    # Batch runs seed each pipeline with its own feed entry
+    if state.get("product_title"):
+        print(f"\n[NODE 1] Using queued product: {state['product_title']}")
+        return {}
+    
+    print("\n[NODE 1] Fetching latest product...")
     
-    print(f"Product: {title}")
+    entries = await afetch_entries(limit=1)
+    if not entries:
+        print("No new products in feed")
+        return {}
     
-    state["product_title"] = title
-    state["product_description"] = description
-    return state
\ No newline at end of file
+    print(f"Product: {entries[0]['product_title']}")
+    return entries[0]
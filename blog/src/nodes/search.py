@@ -1,73 +1,117 @@
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from serpapi import GoogleSearch
 from src.models import BlogState
-from src.config import SERPAPI_KEY, SERP_NUM_RESULTS
+from src.clients import get_async_client
+from src.config import SERPAPI_KEY, SERP_NUM_RESULTS, SERP_QUERIES
 
+SERPAPI_URL = "https://serpapi.com/search.json"
 
-def search_product(state: BlogState) -> BlogState:
-    """Node 5: Search product reviews + specs via SerpAPI"""
-    print("\n[NODE 5] Searching product info via SerpAPI...")
-    
-    product_name = state["normalized_name"]
+
+def _search_params(query: str) -> dict:
+    return {
+        "q": query,
+        "api_key": SERPAPI_KEY,
+        "num": SERP_NUM_RESULTS,
+        "engine": "google"
+    }
+
+
+def _format_section(heading: str, results: dict) -> str:
+    """Render the organic result snippets of one search as a text section"""
+    if "organic_results" not in results:
+        print(f"No {heading.lower()} results found")
+        return ""
     
-    print(f"Searching for: {product_name}")
-    
-    results_text = ""
-    
-    # Search 1: Reviews
-    try:
-        search_params_reviews = {
-            "q": f"{product_name} review",
-            "api_key": SERPAPI_KEY,
-            "num": SERP_NUM_RESULTS,
-            "engine": "google"
-        }
-        
-        search_reviews = GoogleSearch(search_params_reviews)
-        review_results = search_reviews.get_dict()
-        
-        if "organic_results" in review_results:
-            results_text += "=== Reviews ===\n"
-            for result in review_results["organic_results"][:SERP_NUM_RESULTS]:
-                snippet = result.get('snippet', '')
-                if snippet:
-                    results_text += f"- {snippet}\n"
-            print(f"Found {len(review_results['organic_results'])} review results")
-        else:
-            print(f"No review results found")
-            
-    except Exception as e:
-        print(f"Review search error: {e}")
-    
-    # Search 2: Specifications
-    try:
-        search_params_specs = {
-            "q": f"{product_name} specifications",
-            "api_key": SERPAPI_KEY,
-            "num": SERP_NUM_RESULTS,
-            "engine": "google"
-        }
-        
-        search_specs = GoogleSearch(search_params_specs)
-        spec_results = search_specs.get_dict()
-        
-        if "organic_results" in spec_results:
-            results_text += "\n=== Specifications ===\n"
-            for result in spec_results["organic_results"][:SERP_NUM_RESULTS]:
-                snippet = result.get('snippet', '')
-                if snippet:
-                    results_text += f"- {snippet}\n"
-            print(f"Found {len(spec_results['organic_results'])} spec results")
-        else:
-            print(f"No spec results found")
-            
-    except Exception as e:
-        print(f"Spec search error: {e}")
+    section = f"=== {heading} ===\n"
+    for result in results["organic_results"][:SERP_NUM_RESULTS]:
+        snippet = result.get('snippet', '')
+        if snippet:
+            section += f"- {snippet}\n"
+    print(f"Found {len(results['organic_results'])} {heading.lower()} results")
+    return section
+
+
+def _combine_results(state: BlogState, sections: list) -> dict:
+    results_text = "\n".join(section for section in sections if section)
     
     # Fallback: Use product description if no search results
     if len(results_text) < 50:
         print("⚠️  No search results found, using product description")
         results_text = f"=== Product Information ===\n{state['product_description']}"
     
-    state["search_results"] = results_text
     print(f"Gathered {len(results_text)} chars of search data")
-    return state
\ No newline at end of file
+    return {"search_results": results_text}
+
+
+def _run_query(query: str, timeout: float) -> dict:
+    search = GoogleSearch(_search_params(query))
+    search.timeout = timeout  # bounds the underlying requests.get
+    return search.get_dict()
+
+
+def search_product(state: BlogState) -> dict:
+    """Node 5: Search product reviews, specs, prices + alternatives via SerpAPI"""
+    print("\n[NODE 5] Searching product info via SerpAPI...")
+    
+    product_name = state["normalized_name"]
+    
+    print(f"Searching for: {product_name} ({len(SERP_QUERIES)} queries in parallel)")
+    
+    start = time.monotonic()
+    executor = ThreadPoolExecutor(max_workers=len(SERP_QUERIES))
+    futures = [
+        executor.submit(_run_query, template.format(product=product_name), timeout)
+        for _, template, timeout in SERP_QUERIES
+    ]
+    
+    # Sections keep template order; each query waits only up to its own deadline
+    sections = []
+    for (heading, _, timeout), future in zip(SERP_QUERIES, futures):
+        remaining = max(0, start + timeout - time.monotonic())
+        try:
+            sections.append(_format_section(heading, future.result(timeout=remaining)))
+        except FutureTimeoutError:
+            print(f"{heading} search timed out after {timeout}s")
+        except Exception as e:
+            print(f"{heading} search error: {e}")
+    
+    # Don't block the node on searches that already timed out
+    executor.shutdown(wait=False, cancel_futures=True)
+    
+    return _combine_results(state, sections)
+
+
+async def asearch_product(state: BlogState) -> dict:
+    """Node 5 (async): Search product reviews, specs, prices + alternatives via SerpAPI"""
+    print("\n[NODE 5] Searching product info via SerpAPI...")
+    
+    product_name = state["normalized_name"]
+    
+    print(f"Searching for: {product_name} ({len(SERP_QUERIES)} queries in parallel)")
+    
+    client = get_async_client("serpapi")
+    
+    async def run_query(query, timeout):
+        response = await client.get(SERPAPI_URL, params=_search_params(query), timeout=timeout)
+        return response.json()
+    
+    results = await asyncio.gather(
+        *(
+            asyncio.wait_for(run_query(template.format(product=product_name), timeout), timeout)
+            for _, template, timeout in SERP_QUERIES
+        ),
+        return_exceptions=True
+    )
+    
+    sections = []
+    for (heading, _, timeout), result in zip(SERP_QUERIES, results):
+        if isinstance(result, asyncio.TimeoutError):
+            print(f"{heading} search timed out after {timeout}s")
+        elif isinstance(result, Exception):
+            print(f"{heading} search error: {result}")
+        else:
+            sections.append(_format_section(heading, result))
+    
+    return _combine_results(state, sections)
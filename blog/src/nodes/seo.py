@@ -1,68 +1,193 @@
 import json
-import requests
 import base64
+from functools import lru_cache
 from langchain_core.messages import HumanMessage
 from src.models import BlogState
 from src.llm import get_llm
 from src.prompts import get_keyword_generation_prompt
-from src.config import DATAFORSEO_LOGIN, DATAFORSEO_PASSWORD
+from src.batcher import MicroBatcher, AsyncMicroBatcher
+from src.cache import SQLiteCache
+from src.clients import get_session, get_async_client
+from src.config import (
+    DATAFORSEO_LOGIN,
+    DATAFORSEO_PASSWORD,
+    DATAFORSEO_BATCH_WINDOW,
+    DATAFORSEO_MAX_TASKS,
+    SEO_CACHE_PATH,
+    SEO_CACHE_TTL,
+    SEO_CACHE_MAX_ENTRIES,
+)
 
+DATAFORSEO_URL = "https://api.dataforseo.com/v3/keywords_data/google_ads/keywords_for_keywords/live"
+LOCATION_CODE = 2840  # USA
+LANGUAGE_CODE = "en"
 
-def fetch_keywords_dataforseo(keyword):
-    """Fetch keyword suggestions from DataForSEO API"""
-    if not DATAFORSEO_LOGIN or not DATAFORSEO_PASSWORD:
-        print("DataForSEO credentials not configured")
-        return []
+# Fewer DataForSEO keywords than MIN_KEYWORDS get topped up to TARGET_KEYWORDS by the LLM
+MIN_KEYWORDS = 3
+TARGET_KEYWORDS = 4
+
+
+@lru_cache(maxsize=None)
+def get_seo_cache() -> SQLiteCache:
+    """Process-wide DataForSEO response cache, opened on first use"""
+    return SQLiteCache(SEO_CACHE_PATH, ttl=SEO_CACHE_TTL, max_entries=SEO_CACHE_MAX_ENTRIES)
+
+
+def _cache_key(keyword):
+    return SQLiteCache.make_key(keyword, LOCATION_CODE, LANGUAGE_CODE)
+
+
+def _dataforseo_request(keywords):
+    """Build headers and payload: one keywords_for_keywords task per seed keyword"""
+    # Create base64 encoded credentials
+    creds = base64.b64encode(
+        f"{DATAFORSEO_LOGIN}:{DATAFORSEO_PASSWORD}".encode()
+    ).decode()
     
-    try:
-        # Create base64 encoded credentials
-        creds = base64.b64encode(
-            f"{DATAFORSEO_LOGIN}:{DATAFORSEO_PASSWORD}".encode()
-        ).decode()
-        
-        url = "https://api.dataforseo.com/v3/keywords_data/google_ads/keywords_for_keywords/live"
-        
-        headers = {
-            "Authorization": f"Basic {creds}",
-            "Content-Type": "application/json"
-        }
-        
-        payload = [{
+    headers = {
+        "Authorization": f"Basic {creds}",
+        "Content-Type": "application/json"
+    }
+    
+    payload = [
+        {
             "keywords": [keyword],
-            "location_code": 2840,  # USA
-            "language_code": "en",
+            "location_code": LOCATION_CODE,
+            "language_code": LANGUAGE_CODE,
             "include_seed_keyword": True,
             "limit": 10
-        }]
+        }
+        for keyword in keywords
+    ]
+    
+    return headers, payload
+
+
+def _parse_dataforseo(status_code, data, text):
+    """Map each seed keyword to up to 4 keywords from a DataForSEO response"""
+    if status_code != 200:
+        print(f"DataForSEO API error: {status_code}")
+        print(f"Response: {text[:200]}")
+        return {}
+    
+    results = {}
+    
+    # Each task echoes its request data, which tells us which seed it answers
+    for task in data.get("tasks", []):
+        seeds = (task.get("data") or {}).get("keywords") or []
+        if not seeds:
+            continue
         
-        response = requests.post(url, headers=headers, json=payload, timeout=60)
+        keywords = []
+        for item in task.get("result") or []:
+            kw = item.get("keyword")
+            if kw:
+                keywords.append(kw)
         
-        if response.status_code == 200:
-            data = response.json()
-            tasks = data.get("tasks", [])
-            
-            if tasks and tasks[0].get("result"):
-                results = tasks[0]["result"]
-                keywords = []
-                
-                for item in results:
-                    kw = item.get("keyword")
-                    if kw:
-                        keywords.append(kw)
-                
-                return keywords[:4]
+        results[seeds[0]] = keywords[:4]
+    
+    return results
+
+
+def _split_cached(keywords):
+    """Return (cached results, seed keywords that still need an API call)"""
+    cache = get_seo_cache()
+    results, missing = {}, []
+    
+    for keyword in dict.fromkeys(keywords):
+        cached = cache.get(_cache_key(keyword))
+        if cached is not None:
+            print(f"DataForSEO cache hit: {keyword}")
+            results[keyword] = cached
         else:
-            print(f"DataForSEO API error: {response.status_code}")
-            print(f"Response: {response.text[:200]}")
+            missing.append(keyword)
+    
+    return results, missing
+
+
+def _store_fetched(fetched):
+    # Empty results are usually transient errors, so only cache hits
+    for keyword, keywords in fetched.items():
+        if keywords:
+            get_seo_cache().set(_cache_key(keyword), keywords)
+
+
+def _chunks(keywords):
+    for i in range(0, len(keywords), DATAFORSEO_MAX_TASKS):
+        yield keywords[i:i + DATAFORSEO_MAX_TASKS]
+
+
+def fetch_keywords_dataforseo_bulk(keywords):
+    """Fetch keyword suggestions for many seed keywords in as few API calls as possible"""
+    if not DATAFORSEO_LOGIN or not DATAFORSEO_PASSWORD:
+        print("DataForSEO credentials not configured")
+        return {keyword: [] for keyword in keywords}
+    
+    results, missing = _split_cached(keywords)
+    
+    for chunk in _chunks(missing):
+        print(f"DataForSEO request: {len(chunk)} seed keyword(s)")
+        try:
+            headers, payload = _dataforseo_request(chunk)
+            response = get_session("dataforseo").post(DATAFORSEO_URL, headers=headers, json=payload, timeout=60)
+            data = response.json() if response.status_code == 200 else {}
+            fetched = _parse_dataforseo(response.status_code, data, response.text)
+        except Exception as e:
+            print(f"DataForSEO exception: {e}")
+            fetched = {}
         
-        return []
+        _store_fetched(fetched)
+        results.update(fetched)
+    
+    return {keyword: results.get(keyword, []) for keyword in keywords}
+
+
+async def afetch_keywords_dataforseo_bulk(keywords):
+    """Fetch keyword suggestions for many seed keywords in as few API calls as possible (async)"""
+    if not DATAFORSEO_LOGIN or not DATAFORSEO_PASSWORD:
+        print("DataForSEO credentials not configured")
+        return {keyword: [] for keyword in keywords}
+    
+    results, missing = _split_cached(keywords)
+    
+    for chunk in _chunks(missing):
+        print(f"DataForSEO request: {len(chunk)} seed keyword(s)")
+        try:
+            headers, payload = _dataforseo_request(chunk)
+            client = get_async_client("dataforseo")
+            response = await client.post(DATAFORSEO_URL, headers=headers, json=payload, timeout=60)
+            data = response.json() if response.status_code == 200 else {}
+            fetched = _parse_dataforseo(response.status_code, data, response.text)
+        except Exception as e:
+            print(f"DataForSEO exception: {e}")
+            fetched = {}
         
-    except Exception as e:
-        print(f"DataForSEO exception: {e}")
-        return []
+        _store_fetched(fetched)
+        results.update(fetched)
+    
+    return {keyword: results.get(keyword, []) for keyword in keywords}
 
 
-def fetch_seo_keywords(state: BlogState) -> BlogState:
+def fetch_keywords_dataforseo(keyword):
+    """Fetch keyword suggestions from DataForSEO API"""
+    return fetch_keywords_dataforseo_bulk([keyword])[keyword]
+
+
+async def afetch_keywords_dataforseo(keyword):
+    """Fetch keyword suggestions from DataForSEO API (async)"""
+    return (await afetch_keywords_dataforseo_bulk([keyword]))[keyword]
+
+
+# Concurrent pipelines (batch mode) share one DataForSEO call per window
+keyword_batcher = MicroBatcher(
+    fetch_keywords_dataforseo_bulk, DATAFORSEO_BATCH_WINDOW, DATAFORSEO_MAX_TASKS
+)
+async_keyword_batcher = AsyncMicroBatcher(
+    afetch_keywords_dataforseo_bulk, DATAFORSEO_BATCH_WINDOW, DATAFORSEO_MAX_TASKS
+)
+
+
+def fetch_seo_keywords(state: BlogState) -> dict:
     """Node 3: Fetch SEO keywords from DataForSEO"""
     print("\n[NODE 3] Fetching SEO keywords from DataForSEO...")
     
@@ -71,7 +196,10 @@ def fetch_seo_keywords(state: BlogState) -> BlogState:
     # Try DataForSEO
     if DATAFORSEO_LOGIN and DATAFORSEO_PASSWORD:
         print(f"Searching for: {state['normalized_name']}")
-        keywords = fetch_keywords_dataforseo(state["normalized_name"])
+        if DATAFORSEO_BATCH_WINDOW > 0:
+            keywords = keyword_batcher.get(state["normalized_name"])
+        else:
+            keywords = fetch_keywords_dataforseo(state["normalized_name"])
         print(f"DataForSEO returned {len(keywords)} keywords")
         
         if keywords:
@@ -79,31 +207,46 @@ def fetch_seo_keywords(state: BlogState) -> BlogState:
     else:
         print("DataForSEO not configured, will use LLM generation")
     
-    state["seo_keywords"] = keywords
-    return state
+    return {"seo_keywords": keywords}
 
 
-def generate_keywords(state: BlogState) -> BlogState:
-    """Node 4: LLM generates SEO keywords if < 3 from DataForSEO"""
-    if len(state.get("seo_keywords", [])) >= 3:
-        print("\n[NODE 4] Skipping LLM keyword generation (enough keywords)")
-        return state
+async def afetch_seo_keywords(state: BlogState) -> dict:
+    """Node 3 (async): Fetch SEO keywords from DataForSEO"""
+    print("\n[NODE 3] Fetching SEO keywords from DataForSEO...")
     
-    print("\n[NODE 4] Generating SEO keywords with LLM...")
+    keywords = []
     
-    llm = get_llm()
-    prompt = get_keyword_generation_prompt(
+    # Try DataForSEO
+    if DATAFORSEO_LOGIN and DATAFORSEO_PASSWORD:
+        print(f"Searching for: {state['normalized_name']}")
+        if DATAFORSEO_BATCH_WINDOW > 0:
+            keywords = await async_keyword_batcher.get(state["normalized_name"])
+        else:
+            keywords = await afetch_keywords_dataforseo(state["normalized_name"])
+        print(f"DataForSEO returned {len(keywords)} keywords")
+        
+        if keywords:
+            print(f"Keywords: {keywords}")
+    else:
+        print("DataForSEO not configured, will use LLM generation")
+    
+    return {"seo_keywords": keywords}
+
+
+def _keyword_prompt(state: BlogState) -> str:
+    return get_keyword_generation_prompt(
         state["normalized_name"],
         state["product_category"],
         state["product_description"]
     )
-    
-    response = llm.invoke([HumanMessage(content=prompt)])
-    
-    print(f"Raw LLM response: {response.content}")
+
+
+def _parse_generated_keywords(state: BlogState, content: str) -> dict:
+    """Parse LLM keywords into a top-up of seo_keywords, with template keywords as fallback"""
+    print(f"Raw LLM response: {content}")
     
     try:
-        result = json.loads(response.content)
+        result = json.loads(content)
         # Handle both array and object formats
         if isinstance(result, dict) and "keywords" in result:
             keywords = result["keywords"]
@@ -113,7 +256,7 @@ def generate_keywords(state: BlogState) -> BlogState:
             keywords = []
     except json.JSONDecodeError as e:
         print(f"JSON decode error: {e}")
-        print(f"Response content: {response.content}")
+        print(f"Response content: {content}")
         # Fallback keywords
         keywords = [
             f"best {state['normalized_name']}",
@@ -122,6 +265,35 @@ def generate_keywords(state: BlogState) -> BlogState:
             f"buy {state['normalized_name']}"
         ]
     
-    state["seo_keywords"] = keywords
+    # seo_keywords merges updates, so only add what DataForSEO didn't return
+    existing = state.get("seo_keywords", [])
+    keywords = [kw for kw in keywords if kw not in existing][:TARGET_KEYWORDS - len(existing)]
+    
     print(f"Generated keywords: {keywords}")
-    return state
\ No newline at end of file
+    return {"seo_keywords": keywords}
+
+
+def generate_keywords(state: BlogState) -> dict:
+    """Node 4: LLM tops up SEO keywords if < 3 from DataForSEO"""
+    if len(state.get("seo_keywords", [])) >= MIN_KEYWORDS:
+        print("\n[NODE 4] Skipping LLM keyword generation (enough keywords)")
+        return {}
+    
+    print("\n[NODE 4] Generating SEO keywords with LLM...")
+    
+    llm = get_llm()
+    response = llm.invoke([HumanMessage(content=_keyword_prompt(state))])
+    return _parse_generated_keywords(state, response.content)
+
+
+async def agenerate_keywords(state: BlogState) -> dict:
+    """Node 4 (async): LLM tops up SEO keywords if < 3 from DataForSEO"""
+    if len(state.get("seo_keywords", [])) >= MIN_KEYWORDS:
+        print("\n[NODE 4] Skipping LLM keyword generation (enough keywords)")
+        return {}
+    
+    print("\n[NODE 4] Generating SEO keywords with LLM...")
+    
+    llm = get_llm()
+    response = await llm.ainvoke([HumanMessage(content=_keyword_prompt(state))])
+    return _parse_generated_keywords(state, response.content)
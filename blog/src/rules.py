@@ -0,0 +1,256 @@
+"""Rule-based product normalizer: the fast path in front of the LLM in normalize_keyword
+
+Dealnews titles are regular ("<Brand> <model> <specs> <noun> for $<price> +
+free shipping"), so most of them can be normalized with a brand dictionary,
+a category lexicon and a few compiled regexes. normalize_title() also scores
+its own confidence; low-confidence titles (store-wide sales, unknown brands,
+unknown product types, accessories, names that don't fit in MAX_NAME_WORDS)
+are left to the LLM.
+"""
+
+import re
+
+# Lowercase brand spellings -> name used in normalized_name
+BRANDS = {
+    "acer": "acer", "alienware": "alienware", "amazon": "amazon", "anker": "anker",
+    "apple": "apple", "arlo": "arlo", "asus": "asus", "audio-technica": "audio-technica",
+    "beats": "beats", "belkin": "belkin", "blink": "blink", "bose": "bose",
+    "brother": "brother", "canon": "canon", "corsair": "corsair", "crucial": "crucial",
+    "dell": "dell", "dji": "dji", "ecovacs": "ecovacs", "epson": "epson",
+    "eufy": "eufy", "fitbit": "fitbit", "garmin": "garmin", "gigabyte": "gigabyte",
+    "google": "google", "gopro": "gopro", "govee": "govee", "hisense": "hisense", "hp": "hp",
+    "insignia": "insignia", "irobot": "irobot", "jabra": "jabra", "jbl": "jbl",
+    "kasa": "kasa", "kingston": "kingston", "lenovo": "lenovo", "lg": "lg",
+    "logitech": "logitech", "marshall": "marshall", "meta": "meta", "microsoft": "microsoft",
+    "motorola": "motorola", "msi": "msi", "netgear": "netgear", "nikon": "nikon",
+    "nintendo": "nintendo", "oneplus": "oneplus", "panasonic": "panasonic", "philips": "philips",
+    "razer": "razer", "ring": "ring", "roborock": "roborock", "roku": "roku",
+    "samsung": "samsung", "sandisk": "sandisk", "seagate": "seagate", "sennheiser": "sennheiser",
+    "shark": "shark", "shure": "shure", "skullcandy": "skullcandy", "sony": "sony",
+    "tcl": "tcl", "tp-link": "tp-link", "ugreen": "ugreen", "vizio": "vizio",
+    "wd": "wd", "western digital": "wd", "wyze": "wyze", "xbox": "xbox", "xiaomi": "xiaomi",
+}
+
+# (category, generic nouns, product lines). A generic noun ends the product
+# name ("... Wireless Headphones"); a product line is part of it ("AirPods").
+CATEGORIES = [
+    ("wireless earbuds", ["earbuds", "earphones", "in-ear headphones"], ["airpods", "galaxy buds\\w*", "buds\\w*"]),
+    ("vr headset", ["vr headset"], ["quest \\d\\w*"]),
+    ("headphones", ["headphones", "headset"], []),
+    ("soundbar", ["soundbar", "sound bar"], []),
+    ("smart speaker", ["smart speaker"], ["echo dot", "echo", "nest hub", "homepod"]),
+    ("bluetooth speaker", ["bluetooth speaker", "portable speaker", "speaker"], []),
+    ("gaming monitor", ["gaming monitor"], ["odyssey", "ultragear"]),
+    ("monitor", ["monitor"], []),
+    ("streaming device", ["streaming stick", "streaming player"], ["fire tv stick", "chromecast"]),
+    ("smart tv", ["smart tv", "google tv", "fire tv", "roku tv", "tv", "television"], ["bravia"]),
+    ("gaming laptop", ["gaming laptop"], ["rog strix", "legion", "alienware m\\d+"]),
+    ("laptop", ["laptop", "notebook"], ["macbook \\w+", "chromebook", "thinkpad", "inspiron", "pavilion"]),
+    ("tablet", ["tablet"], ["ipad \\w*", "galaxy tab"]),
+    ("e-reader", ["e-reader", "ereader"], ["kindle"]),
+    ("smartwatch", ["smartwatch", "smart watch"], ["apple watch", "galaxy watch\\w*"]),
+    ("fitness tracker", ["fitness tracker"], []),
+    ("smartphone", ["smartphone", "phone"], ["iphone", "pixel \\d\\w*", "galaxy s\\d+\\w*"]),
+    ("portable ssd", ["portable ssd"], []),
+    ("ssd", ["nvme ssd", "ssd", "solid state drive"], []),
+    ("external hard drive", ["hard drive", "hdd"], ["my passport"]),
+    ("memory card", ["microsdxc card", "microsd card", "sd card", "memory card"], []),
+    ("power bank", ["power bank", "portable charger"], []),
+    ("charger", ["charging stand", "charging station", "charger"], []),
+    ("usb-c hub", ["usb-c hub", "docking station", "hub"], []),
+    ("computer mouse", ["mouse"], []),
+    ("keyboard", ["keyboard"], []),
+    ("wifi router", ["mesh wifi \\d* ?system", "router"], ["deco", "nighthawk"]),
+    ("security camera", ["security camera", "doorbell"], ["solocam", "cam v\\d"]),
+    ("gaming console", ["console"], ["playstation \\d", "switch", "series [xs]"]),
+    ("drone", ["drone"], []),
+    ("camera", ["action camera", "mirrorless camera", "camera"], []),
+    ("printer", ["printer"], ["ecotank"]),
+    ("robot vacuum", ["robot vacuum"], ["roomba", "deebot"]),
+    ("smart plug", ["smart plug"], []),
+    ("smart lighting", ["led strip lights", "strip lights", "smart bulb"], []),
+    ("webcam", ["webcam"], []),
+    ("microphone", ["microphone", "mic"], []),
+    ("turntable", ["turntable"], []),
+    ("graphics card", ["graphics card"], ["geforce rtx \\d+\\w*"]),
+    ("computer memory", ["ram kit", "ram"], []),
+]
+
+# Store-wide or multi-product deals have no single product to name
+MULTI_PRODUCT = re.compile(
+    r"\b(up to \$?\d+%?|extra savings|sale|deals|select|sitewide)\b|%\s*off\b|^.{0,40}:", re.I
+)
+DEAL_SUFFIX = re.compile(r"\s+(for|from)\s+\$.*$|\s+\+\s+free shipping.*$|\s+w/\s.*$", re.I)
+CONDITION_PREFIX = re.compile(r"^(certified\s+)?(refurb(ished)?|open-box|used|new)\s+", re.I)
+# Generation markers and multi-word specs ("2nd Gen", "Mini LED", "WiFi 6", "5.1 Channel")
+SPEC_PHRASES = re.compile(
+    r"\b(\d+(st|nd|rd|th)\s+gen(eration)?|gen\s*\d+|mini[- ]led|noise[- ]cancel+ing"
+    r"|wi-?fi\s*\d+e?|\d\.\d(\.\d)?\s+channel)\b",
+    re.I
+)
+# Sizes, capacities and model years ("2024"); a number inside a product line ("RTX 4070") is kept
+SPEC_TOKEN = re.compile(
+    r'^(\d+(\.\d+)?("|-?in\.?|gb|tb|mah|w|mm|hz|-ft\.?|-pack|-in-\d+|,\d+mah)|\(?(19|20)\d{2}\)?|[48]k|[234]-pack)$'
+)
+# Descriptors are dropped after the last model token ("Flip 6 Portable Speaker") and kept
+# between model tokens ("Fire HD 10"); fillers are always dropped
+DESCRIPTORS = {
+    "class", "smart", "wireless", "bluetooth", "noise", "canceling", "cancelling", "portable",
+    "unlocked", "wifi", "wi-fi", "gps", "usb", "usb-c", "hd", "uhd", "qled", "oled", "led",
+    "mechanical", "rgb", "gaming", "running", "digital", "curved",
+    "desktop", "external", "pro+",
+}
+FILLERS = {"the", "and", "with", "&", "-"}
+# Descriptors that are often part of the name ("Crystal UHD", "Switch OLED"); dropping one is a guess
+NAME_DESCRIPTORS = {"hd", "uhd", "qled", "oled", "led", "rgb"}
+# Plain words that still belong to a model number ("990 Pro", "HERO13 Black"); any other
+# plain word after the number is a description ("HL-L2350DW Monochrome Laser")
+MODEL_SUFFIXES = {
+    "pro", "plus", "max", "mini", "ultra", "slim", "lite", "se", "fe", "s", "x", "xl", "ti",
+    "super", "omni", "evo", "neo", "air", "black", "white", "ii", "iii", "iv",
+}
+# A title naming a product it is *for* ("Case for Galaxy S24", "Ring Light for Phone")
+ACCESSORY = re.compile(
+    r"\b(cases?|covers?|bands?|straps?|lights?|adapters?|cables?|mounts?|holders?|stands?"
+    r"|skins?|sleeves?|screen protectors?|replacement|for)\b",
+    re.I
+)
+# Words that never belong in a product name; left over, they mean the name was cut badly
+LEFTOVER_WORDS = {"for", "of", "to", "in", "on", "by", "compatible"}
+
+# Score: brand + category is enough; a price alone only confirms a single-product deal
+BRAND_SCORE = 0.5
+CATEGORY_SCORE = 0.3
+PRICE_SCORE = 0.2
+# Penalties push an otherwise complete match below NORMALIZER_MIN_CONFIDENCE
+ACCESSORY_PENALTY = 0.5
+LEFTOVER_PENALTY = 0.3
+DOUBTFUL_PENALTY = 0.3
+TRUNCATED_PENALTY = 0.3
+MAX_NAME_WORDS = 4
+
+
+def _alternation(terms):
+    return re.compile(r"\b(" + "|".join(terms) + r")\b", re.I)
+
+
+BRAND_PATTERN = _alternation(sorted(map(re.escape, BRANDS), key=len, reverse=True))
+CATEGORY_PATTERNS = [
+    (category, _alternation(nouns), _alternation(lines) if lines else None)
+    for category, nouns, lines in CATEGORIES
+]
+NOUNS = {noun for _, nouns, _ in CATEGORIES for noun in nouns}
+
+
+def _product_text(title: str) -> str:
+    """Title without the price/shipping tail, condition prefix and multi-word specs"""
+    text = DEAL_SUFFIX.sub("", title.strip())
+    text = CONDITION_PREFIX.sub("", text)
+    return SPEC_PHRASES.sub(" ", text)
+
+
+def _find_category(text: str):
+    """Return (category, generic noun match or None, product line match or None)"""
+    for category, nouns, lines in CATEGORY_PATTERNS:
+        noun = nouns.search(text)
+        line = lines.search(text) if lines else None
+        if noun or line:
+            return category, noun, line
+    return None, None, None
+
+
+def _name_tokens(text: str, keep=()) -> tuple:
+    """Model tokens of text and whether the cut is doubtful; tokens in keep survive the spec filter
+    
+    Doubtful means a filler was dropped from between model tokens, a name-like
+    descriptor was dropped after them, or a plain word follows the model number.
+    """
+    tokens = [t.strip(",.") for t in text.lower().replace("(", " ").replace(")", " ").split()]
+    tokens = [t for t in tokens if t]
+    is_model = [
+        t in keep or (t not in DESCRIPTORS and t not in FILLERS and not SPEC_TOKEN.match(t))
+        for t in tokens
+    ]
+    if not any(is_model):
+        return [], False
+    first = is_model.index(True)
+    last = len(is_model) - 1 - is_model[::-1].index(True)
+    
+    name, doubtful = [], False
+    for i, token in enumerate(tokens):
+        between = first < i < last
+        if is_model[i] or (between and token in DESCRIPTORS):
+            name.append(token)
+        elif (between and token in FILLERS) or (i > last and token in NAME_DESCRIPTORS):
+            doubtful = True
+    
+    numbered = False
+    for token in name:
+        if numbered and token.isalpha() and token not in MODEL_SUFFIXES and token not in DESCRIPTORS:
+            doubtful = True
+        numbered = numbered or any(c.isdigit() for c in token)
+    return name, doubtful
+
+
+def _is_accessory(text: str, noun) -> bool:
+    """Accessory words outside the category noun ("charging stand" is a product, "stand" alone isn't)"""
+    return any(
+        noun is None or not (noun.start() <= match.start() and match.end() <= noun.end())
+        for match in ACCESSORY.finditer(text)
+    )
+
+
+def normalize_title(title: str) -> dict:
+    """Normalize a deal title without the LLM
+    
+    Returns {"name", "category", "confidence"} with confidence in [0, 1];
+    name and category are None when nothing usable was found.
+    """
+    if MULTI_PRODUCT.search(DEAL_SUFFIX.sub("", title)):
+        return {"name": None, "category": None, "confidence": 0.0}
+    
+    text = _product_text(title)
+    if not text.strip():
+        return {"name": None, "category": None, "confidence": 0.0}
+    
+    confidence = PRICE_SCORE if re.search(r"\s(for|from)\s+\$\d", title, re.I) else 0.0
+    
+    # The brand has to lead the title, otherwise it is probably an accessory "for" it
+    brand_match = BRAND_PATTERN.search(text)
+    if brand_match and brand_match.start() > len(text.split()[0]) + 1:
+        brand_match = None
+    if brand_match:
+        confidence += BRAND_SCORE
+        text = text[brand_match.end():]
+    
+    category, noun, line = _find_category(text)
+    if category:
+        confidence += CATEGORY_SCORE
+    if _is_accessory(text, noun):
+        confidence -= ACCESSORY_PENALTY
+    
+    keep = set(line.group(0).lower().split()) if line else ()
+    model, doubtful = _name_tokens(text if noun is None else text[:noun.start()], keep)
+    if doubtful:
+        confidence -= DOUBTFUL_PENALTY
+    brand = [BRANDS[brand_match.group(0).lower()]] if brand_match else []
+    name = brand + model
+    if len(name) > MAX_NAME_WORDS:
+        confidence -= TRUNCATED_PENALTY
+        name = name[:MAX_NAME_WORDS]
+    if LEFTOVER_WORDS & set(name):
+        confidence -= LEFTOVER_PENALTY
+    
+    # "sony wh-1000xm5" reads better as "sony wh-1000xm5 headphones"; the noun loses its
+    # descriptors ("smart tv" -> "tv") only when what is left is a noun too ("smart plug" stays)
+    if noun is not None and len(name) < 3:
+        noun_words = _name_tokens(noun.group(0))[0]
+        if " ".join(noun_words) not in NOUNS:
+            noun_words = noun.group(0).lower().split()
+        name = (name + noun_words)[:MAX_NAME_WORDS]
+    
+    return {
+        "name": " ".join(name) or None,
+        "category": category,
+        "confidence": round(min(max(confidence, 0.0), 1.0), 2) if name else 0.0,
+    }
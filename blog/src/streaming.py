@@ -0,0 +1,157 @@
+"""Incremental JSON validation for streamed LLM output"""
+
+import re
+
+NUMBER = re.compile(r"-?(0|[1-9]\d*)(\.\d+)?([eE][+-]?\d+)?")
+LITERALS = ("true", "false", "null")
+ESCAPES = set('"\\/bfnrtu')
+HEX_DIGITS = set("0123456789abcdefABCDEF")
+WHITESPACE = set(" \t\r\n")
+
+# Parser states
+VALUE, OBJECT_START, KEY, COLON, ARRAY_START, AFTER_VALUE, DONE = range(7)
+
+
+class JSONPrefixValidator:
+    """Checks, chunk by chunk, that streamed text can still become valid JSON
+    
+    feed() returns False at the first character that no JSON document could
+    continue with, so a broken generation can be dropped right there instead
+    of after the last token. The grammar is the one json.loads enforces,
+    including its rejection of raw control characters inside strings.
+    """
+    
+    def __init__(self):
+        self.state = VALUE
+        self.stack = []
+        self.position = 0
+        self.error = None
+        self._string = None  # "key" or "value" while inside a string
+        self._escape = False
+        self._hex_left = 0  # digits still expected after \u
+        self._token = ""  # number or literal being read
+    
+    @property
+    def complete(self) -> bool:
+        """A whole JSON document has been read (trailing whitespace allowed)"""
+        return self.error is None and (self.state == DONE or self._top_level_token_done())
+    
+    def _top_level_token_done(self) -> bool:
+        return not self.stack and self.state == VALUE and bool(NUMBER.fullmatch(self._token))
+    
+    def feed(self, chunk: str) -> bool:
+        if self.error:
+            return False
+        for char in chunk:
+            if not self._feed_char(char):
+                self.error = f"unexpected {char!r} at char {self.position}"
+                return False
+            self.position += 1
+        return True
+    
+    def _end_value(self):
+        self.state = AFTER_VALUE if self.stack else DONE
+    
+    def _feed_char(self, char: str) -> bool:
+        if self._string:
+            return self._feed_string(char)
+        if self._token:
+            if self._feed_token(char):
+                return True
+            if not self._finish_token():
+                return False
+        
+        if char in WHITESPACE:
+            return True
+        
+        if self.state in (VALUE, ARRAY_START):
+            if self.state == ARRAY_START and char == "]":
+                self.stack.pop()
+                self._end_value()
+                return True
+            return self._start_value(char)
+        
+        if self.state in (OBJECT_START, KEY):
+            if char == '"':
+                self._string = "key"
+                return True
+            if self.state == OBJECT_START and char == "}":
+                self.stack.pop()
+                self._end_value()
+                return True
+            return False
+        
+        if self.state == COLON:
+            if char == ":":
+                self.state = VALUE
+                return True
+            return False
+        
+        if self.state == AFTER_VALUE:
+            container = self.stack[-1]
+            if char == ",":
+                self.state = KEY if container == "{" else VALUE
+                return True
+            if (container, char) in (("{", "}"), ("[", "]")):
+                self.stack.pop()
+                self._end_value()
+                return True
+            return False
+        
+        return False  # DONE: only whitespace may follow
+    
+    def _start_value(self, char: str) -> bool:
+        if char in "{[":
+            self.stack.append(char)
+            self.state = OBJECT_START if char == "{" else ARRAY_START
+            return True
+        if char == '"':
+            self._string = "value"
+            return True
+        if char == "-" or char.isdigit() or char in "tfn":
+            self._token = char
+            self.state = VALUE
+            return True
+        return False
+    
+    def _feed_string(self, char: str) -> bool:
+        if self._hex_left:
+            self._hex_left -= 1
+            return char in HEX_DIGITS
+        if self._escape:
+            self._escape = False
+            if char == "u":
+                self._hex_left = 4
+            return char in ESCAPES
+        if char == "\\":
+            self._escape = True
+            return True
+        if char == '"':
+            if self._string == "key":
+                self.state = COLON
+            else:
+                self._end_value()
+            self._string = None
+            return True
+        # json.loads rejects raw control characters (e.g. newlines) inside strings
+        return ord(char) >= 0x20
+    
+    def _feed_token(self, char: str) -> bool:
+        """Extend the current number/literal; False means the token has ended"""
+        if self._token[0] in "tfn":
+            candidate = self._token + char
+            if any(literal.startswith(candidate) for literal in LITERALS):
+                self._token = candidate
+                return True
+            return False
+        if char.isdigit() or char in "+-.eE":
+            self._token += char
+            return True
+        return False
+    
+    def _finish_token(self) -> bool:
+        token, self._token = self._token, ""
+        if token in LITERALS or NUMBER.fullmatch(token):
+            self._end_value()
+            return True
+        return False
@@ -1,5 +1,6 @@
 from langgraph.graph import StateGraph, END
 from src.models import BlogState
+from src.instrumentation import instrument
 from src.nodes import (
     fetch_product,
     normalize_keyword,
@@ -8,30 +9,73 @@ from src.nodes import (
     search_product,
     generate_blog,
     publish_blog,
+    afetch_product,
+    anormalize_keyword,
+    afetch_seo_keywords,
+    agenerate_keywords,
+    asearch_product,
+    agenerate_blog,
+    apublish_blog,
 )
 
+SYNC_NODES = {
+    "fetch_product": fetch_product,
+    "normalize_keyword": normalize_keyword,
+    "fetch_seo_keywords": fetch_seo_keywords,
+    "generate_keywords": generate_keywords,
+    "search_product": search_product,
+    "generate_blog": generate_blog,
+    "publish_blog": publish_blog,
+}
 
-def create_workflow():
-    """Create LangGraph workflow"""
+# Same graph driven by ainvoke/abatch on a single event loop
+ASYNC_NODES = {
+    "fetch_product": afetch_product,
+    "normalize_keyword": anormalize_keyword,
+    "fetch_seo_keywords": afetch_seo_keywords,
+    "generate_keywords": agenerate_keywords,
+    "search_product": asearch_product,
+    "generate_blog": agenerate_blog,
+    "publish_blog": apublish_blog,
+}
+
+
+def has_product(state: BlogState) -> str:
+    return "normalize_keyword" if state.get("product_title") else END
+
+
+def create_workflow(use_async: bool = False, parallel: bool = True, checkpointer=None):
+    """Create LangGraph workflow
+    
+    With a checkpointer, state is saved after every node under the run's
+    thread_id, and invoking again with that thread_id resumes a failed run.
+    """
     workflow = StateGraph(BlogState)
     
     # Add nodes
-    workflow.add_node("fetch_product", fetch_product)
-    workflow.add_node("normalize_keyword", normalize_keyword)
-    workflow.add_node("fetch_seo_keywords", fetch_seo_keywords)
-    workflow.add_node("generate_keywords", generate_keywords)
-    workflow.add_node("search_product", search_product)
-    workflow.add_node("generate_blog", generate_blog)
-    workflow.add_node("publish_blog", publish_blog)
+    nodes = ASYNC_NODES if use_async else SYNC_NODES
+    for name, node in nodes.items():
+        workflow.add_node(name, instrument(node, name))
     
-    # Define edges (linear flow)
     workflow.set_entry_point("fetch_product")
-    workflow.add_edge("fetch_product", "normalize_keyword")
-    workflow.add_edge("normalize_keyword", "fetch_seo_keywords")
-    workflow.add_edge("fetch_seo_keywords", "generate_keywords")
-    workflow.add_edge("generate_keywords", "search_product")
-    workflow.add_edge("search_product", "generate_blog")
+    # Nothing new in the feed: end the run before any API call
+    workflow.add_conditional_edges("fetch_product", has_product, ["normalize_keyword", END])
+    
+    if parallel:
+        # Fan-out: keyword research and SERP research only need normalized_name
+        workflow.add_edge("normalize_keyword", "fetch_seo_keywords")
+        workflow.add_edge("fetch_seo_keywords", "generate_keywords")
+        workflow.add_edge("normalize_keyword", "search_product")
+        # Fan-in: generate_blog waits for both branches
+        workflow.add_edge(["generate_keywords", "search_product"], "generate_blog")
+    else:
+        # Linear flow
+        workflow.add_edge("normalize_keyword", "fetch_seo_keywords")
+        workflow.add_edge("fetch_seo_keywords", "generate_keywords")
+        workflow.add_edge("generate_keywords", "search_product")
+        workflow.add_edge("search_product", "generate_blog")
+    
     workflow.add_edge("generate_blog", "publish_blog")
     workflow.add_edge("publish_blog", END)
     
-    return workflow.compile()
\ No newline at end of file
+    return workflow.compile(checkpointer=checkpointer)
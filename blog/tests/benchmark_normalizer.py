@@ -0,0 +1,134 @@
+"""Measure how often the rule-based normalizer spares normalize_keyword an LLM call
+
+Runs src.rules.normalize_title over a fixture corpus of labeled dealnews
+titles and reports the hit rate (confidence >= NORMALIZER_MIN_CONFIDENCE),
+how many of those hits match the expected name and category, the rule
+engine's own latency and the LLM time saved. Without --live the LLM latency
+is an assumed value (LLM_LATENCY), not a measurement; --live calls the
+configured LLM for every title instead, measures it and scores its answers too.
+Exits with status 1 if any rule hit is wrong, so it can gate changes to rules.py.
+
+Usage (from the blog/ directory):
+    python tests/benchmark_normalizer.py
+    python tests/benchmark_normalizer.py --live
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.rules import normalize_title
+from src.config import NORMALIZER_MIN_CONFIDENCE
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "dealnews_titles.txt")
+
+# Assumed normalize_keyword LLM round trip in seconds; run with --live to measure it
+LLM_LATENCY = 1.5
+
+
+def load_titles(path):
+    """{title: (expected name, expected category)}, None for "-" """
+    titles = {}
+    with open(path) as f:
+        for line in f:
+            if not line.strip() or line.startswith("#"):
+                continue
+            title, name, category = (part.strip() for part in line.split(" | "))
+            titles[title] = (None if name == "-" else name, None if category == "-" else category)
+    return titles
+
+
+def is_correct(answer, expected):
+    """Name and category both match the label (case-insensitive)"""
+    name, category = answer
+    return (name or "").lower() == (expected[0] or "") and (category or "").lower() == (expected[1] or "")
+
+
+def time_rules(titles, runs):
+    """Best-of-runs seconds per title for the rule engine"""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        for title in titles:
+            normalize_title(title)
+        best = min(best, time.perf_counter() - start)
+    return best / len(titles)
+
+
+def time_llm(titles):
+    """Mean seconds per title for the LLM path, plus its (name, category) answers"""
+    import json
+    from langchain_core.messages import HumanMessage
+    from src.llm import get_llm
+    from src.prompts import get_normalize_prompt
+    
+    llm = get_llm()
+    answers = {}
+    start = time.perf_counter()
+    for title in titles:
+        response = llm.invoke([HumanMessage(content=get_normalize_prompt(title))])
+        try:
+            answer = json.loads(response.content)
+            answers[title] = (answer.get("name"), answer.get("category"))
+        except json.JSONDecodeError:
+            answers[title] = (None, None)
+    return (time.perf_counter() - start) / len(titles), answers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixture", default=FIXTURE, help="file with one 'title | name | category' per line")
+    parser.add_argument("--runs", type=int, default=20, help="passes over the corpus (best time is reported)")
+    parser.add_argument("--live", action="store_true", help="call the configured LLM for every title")
+    args = parser.parse_args()
+    
+    expected = load_titles(args.fixture)
+    titles = list(expected)
+    results = {title: normalize_title(title) for title in titles}
+    hits = [t for t in titles if results[t]["confidence"] >= NORMALIZER_MIN_CONFIDENCE]
+    correct = [t for t in hits if is_correct((results[t]["name"], results[t]["category"]), expected[t])]
+    rules_latency = time_rules(titles, args.runs)
+    
+    llm_latency, answers = LLM_LATENCY, {}
+    if args.live:
+        llm_latency, answers = time_llm(titles)
+    
+    before = len(titles) * llm_latency
+    after = len(titles) * rules_latency + (len(titles) - len(hits)) * llm_latency
+    
+    print("=" * 60)
+    print("normalize_keyword: rules fast path vs LLM only")
+    print("=" * 60)
+    for title in titles:
+        result = results[title]
+        source = "rules" if title in hits else "LLM  "
+        mark = ("ok " if title in correct else "BAD") if title in hits else "   "
+        line = f"{source} {mark} {result['confidence']:.2f}  {title[:45]:45}  -> {result['name']}"
+        if title in hits and title not in correct:
+            line += f"  (expected {expected[title][0]})"
+        if answers:
+            line += f"  | LLM: {answers[title][0]}"
+        print(line)
+    print("=" * 60)
+    print(f"Titles:          {len(titles)}")
+    print(f"Rule hit rate:   {len(hits) / len(titles):.0%} ({len(hits)} titles, threshold {NORMALIZER_MIN_CONFIDENCE})")
+    if hits:
+        print(f"Rule accuracy:   {len(correct) / len(hits):.0%} of hits match the expected name and category "
+              f"({len(hits) - len(correct)} wrong)")
+    if answers:
+        llm_correct = sum(is_correct(answers[t], expected[t]) for t in titles)
+        print(f"LLM accuracy:    {llm_correct / len(titles):.0%} of all titles")
+    print(f"Rules latency:   {rules_latency * 1e6:.0f}µs per title")
+    print(f"LLM latency:     {llm_latency:.2f}s per title ({'measured' if args.live else 'assumed, not measured; use --live'})")
+    print(f"LLM only:        {before:.1f}s")
+    print(f"Rules + LLM:     {after:.1f}s ({before - after:.1f}s saved, {before / after:.1f}x faster)")
+    print("=" * 60)
+    
+    if len(correct) < len(hits):
+        sys.exit(f"{len(hits) - len(correct)} rule hit(s) do not match the expected name and category")
+
+
+if __name__ == "__main__":
+    main()
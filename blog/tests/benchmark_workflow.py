@@ -0,0 +1,83 @@
+"""Compare wall time of the linear and fan-out/fan-in blog graphs
+
+Nodes are replaced by stand-ins that sleep for an assumed API/LLM latency,
+so the comparison costs nothing and doesn't publish anything.
+
+Usage (from the blog/ directory):
+    python tests/benchmark_workflow.py
+    python tests/benchmark_workflow.py --scale 0.5 --runs 5
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import workflow
+from src.workflow import create_workflow
+
+# Assumed per-node latency in seconds (not measured); --scale shrinks or stretches it
+LATENCY = {
+    "fetch_product": 0.8,
+    "normalize_keyword": 1.5,
+    "fetch_seo_keywords": 4.0,
+    "generate_keywords": 1.5,
+    "search_product": 3.0,
+    "generate_blog": 6.0,
+    "publish_blog": 1.2,
+}
+
+UPDATES = {
+    "fetch_product": {"product_title": "Apple AirPods Pro", "product_description": "deal"},
+    "normalize_keyword": {"normalized_name": "apple airpods pro", "product_category": "earbuds"},
+    "fetch_seo_keywords": {"seo_keywords": ["airpods pro"]},
+    "generate_keywords": {"seo_keywords": ["best airpods pro", "airpods pro price", "buy airpods pro"]},
+    "search_product": {"search_results": "=== Reviews ===\n- great"},
+    "generate_blog": {"blog_title": "Best AirPods Pro", "blog_content": "..."},
+    "publish_blog": {"publish_url": "https://example.com/post/"},
+}
+
+
+def simulated(name, scale):
+    def node(state):
+        time.sleep(LATENCY[name] * scale)
+        return UPDATES[name]
+    return node
+
+
+def time_graph(parallel, runs):
+    app = create_workflow(parallel=parallel)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = app.invoke({})
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=0.1, help="multiplier for simulated latencies")
+    parser.add_argument("--runs", type=int, default=3, help="runs per graph (best time is reported)")
+    args = parser.parse_args()
+    
+    for name in workflow.SYNC_NODES:
+        workflow.SYNC_NODES[name] = simulated(name, args.scale)
+    
+    linear, linear_result = time_graph(parallel=False, runs=args.runs)
+    parallel, parallel_result = time_graph(parallel=True, runs=args.runs)
+    
+    assert linear_result == parallel_result, "graphs produced different final states"
+    
+    print("=" * 60)
+    print("Blog workflow: linear vs fan-out/fan-in (assumed node latencies)")
+    print("=" * 60)
+    print(f"Linear graph:   {linear:.2f}s")
+    print(f"Parallel graph: {parallel:.2f}s")
+    print(f"Speedup:        {linear / parallel:.2f}x ({linear - parallel:.2f}s saved per post)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
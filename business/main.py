@@ -1,36 +1,151 @@
-import sys
+import argparse
+from datetime import datetime, timezone
 from src.models import GraphState
 from src.graph import create_workflow
+from src.checkpoint import new_thread_id, thread_config, sqlite_checkpointer
+from src.config import Config
+from src.instrumentation import print_summary, export_jsonl
+from src.context import print_report
+from src.batch import read_requirements, run_batch, write_manifest
+
+# Example requirement (you can change this or pass one on the command line)
+DEFAULT_REQUIREMENT = "Build a system that recommends products to users based on browsing history."
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Convert a business requirement into a technical specification")
+    parser.add_argument(
+        "requirement",
+        nargs="*",
+        help="business requirement in plain language (default: built-in example)"
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="THREAD_ID",
+        help="continue a failed run from its last completed node"
+    )
+    parser.add_argument(
+        "--dag",
+        action="store_true",
+        help="run independent stages in parallel (per-module schemas, per-workflow pseudo-code); "
+             "pass it again with --resume"
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="convert every requirement in a JSONL or CSV file ('-' reads stdin)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=Config.BATCH_WORKERS,
+        help=f"requirements processed at once in batch mode (default: {Config.BATCH_WORKERS})"
+    )
+    parser.add_argument(
+        "--manifest",
+        metavar="PATH",
+        help="where batch mode writes its summary (default: Outputs/batch_<time>.json)"
+    )
+    args = parser.parse_args()
+    if args.batch and (args.resume or args.requirement):
+        parser.error("--batch reads requirements from FILE; it can't be combined with --resume or a requirement")
+    return args
+
+
+def run_pipeline(requirement: str, thread_id: str, resume: bool, mode: str = "sequential") -> dict:
+    """Run (or resume) the workflow with checkpoints saved under thread_id."""
+    config = thread_config(thread_id)
+    
+    with sqlite_checkpointer() as checkpointer:
+        app = create_workflow(checkpointer=checkpointer, mode=mode)
+        
+        if not resume:
+            return app.invoke(GraphState(requirement=requirement), config)
+        
+        snapshot = app.get_state(config)
+        if not snapshot.values:
+            raise SystemExit(f"❌ No checkpoint found for run {thread_id}")
+        if not snapshot.next:
+            print(f"✅ Run {thread_id} already completed")
+            return snapshot.values
+        
+        print(f"⏩ Resuming at: {', '.join(snapshot.next)}")
+        print()
+        # None continues from the checkpoint instead of starting over
+        return app.invoke(None, config)
+
+
+def print_metrics():
+    """Print per-node timings, token usage and prompt sizes, and append the node records to the metrics file."""
+    print_summary()
+    print_report()
+    export_jsonl(Config.METRICS_PATH)
+    print(f"📈 Node metrics appended to {Config.METRICS_PATH}")
+
+
+def main_batch(args, mode: str):
+    """Convert every requirement in args.batch and write the manifest."""
+    try:
+        items = read_requirements(args.batch)
+    except ValueError as e:
+        raise SystemExit(f"❌ {e}")
+    if not items:
+        raise SystemExit(f"❌ No requirements found in {args.batch}")
+    
+    started_at = datetime.now(timezone.utc)
+    print(f"📚 Batch: {len(items)} requirements, {args.workers} at a time ({mode} mode)")
+    print("-" * 80)
+    print()
+    
+    results = run_batch(items, workers=args.workers, mode=mode)
+    manifest_path = write_manifest(results, started_at, mode, args.workers, args.manifest)
+    failed = sum(entry["status"] != "ok" for entry in results)
+    
+    print()
+    print("-" * 80)
+    print(f"✨ Batch finished: {len(results) - failed} succeeded, {failed} failed")
+    print(f"🧾 Manifest: {manifest_path}")
+    print("=" * 80)
+    print_metrics()
 
 
 def main():
     """Main entry point for the requirement conversion pipeline."""
+    args = parse_args()
     
     print("=" * 80)
     print("🤖 AI-Based Requirement to Technical Specification Pipeline")
     print("=" * 80)
     print()
     
-    # Example requirement (you can change this or take input)
-    requirement = "Build a system that recommends products to users based on browsing history."
+    if args.batch:
+        main_batch(args, "dag" if args.dag else "sequential")
+        return
     
-    # Allow custom requirement via command line
-    if len(sys.argv) > 1:
-        requirement = " ".join(sys.argv[1:])
+    requirement = " ".join(args.requirement) or DEFAULT_REQUIREMENT
+    thread_id = args.resume or new_thread_id()
+    mode = "dag" if args.dag else "sequential"
     
-    print(f"📋 Business Requirement:")
-    print(f"   {requirement}")
-    print()
+    if not args.resume:
+        print(f"📋 Business Requirement:")
+        print(f"   {requirement}")
+        print()
+    print(f"🧵 Run id: {thread_id}")
+    if args.dag:
+        print("🔀 DAG mode: independent stages run in parallel")
     print("🔄 Starting conversion pipeline...")
     print("-" * 80)
     print()
     
-    # Create initial state
-    initial_state = GraphState(requirement=requirement)
-    
-    # Create and run workflow
-    app = create_workflow()
-    result = app.invoke(initial_state)
+    try:
+        result = run_pipeline(requirement, thread_id, resume=bool(args.resume), mode=mode)
+    except Exception:
+        print()
+        print("❌ Pipeline failed. Completed stages are saved; continue with:")
+        print(f"   python main.py --resume {thread_id}{' --dag' if args.dag else ''}")
+        print_metrics()
+        raise
     
     # Extract title from result dictionary
     title = result.get("title", "Unknown Project")
@@ -40,7 +155,8 @@ def main():
     print("✨ Pipeline completed successfully!")
     print(f"📁 Technical specification generated for: '{title}'")
     print("=" * 80)
+    print_metrics()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,142 @@
+"""Batch mode: convert many requirements concurrently and write a manifest."""
+
+import csv
+import io
+import sys
+import json
+import time
+from pathlib import Path
+from collections import Counter
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from src.models import GraphState
+from src.graph import create_workflow
+from src.checkpoint import new_thread_id, thread_config, sqlite_checkpointer
+from src.config import Config
+from src.utils import report_path
+
+
+def _item(index: int, record, where: str) -> dict:
+    """Normalize one input record to {"id", "requirement"}."""
+    if isinstance(record, str):
+        record = {"requirement": record}
+    if not isinstance(record, dict):
+        raise ValueError(f"{where}: expected a JSON object or string, got {type(record).__name__}")
+    requirement = record.get("requirement") or ""
+    if not isinstance(requirement, str):
+        raise ValueError(f"{where}: 'requirement' must be a string, got {type(requirement).__name__}")
+    item_id = str(record.get("id") or "").strip() or f"{index:04d}"
+    return {"id": item_id, "requirement": requirement.strip()}
+
+
+def _parse_line(line: str, where: str, strict: bool):
+    """A JSON line, or (unless strict) plain text when it doesn't look like JSON."""
+    if not strict and not line.startswith(("{", '"')):
+        return line
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"{where}: invalid JSON ({e.msg})") from None
+
+
+def read_requirements(path: str) -> list:
+    """Read requirements from a JSONL or CSV file, or from stdin with "-".
+    
+    JSONL lines are {"requirement": ..., "id": ...} objects or plain JSON
+    strings; CSV needs a "requirement" column and may have an "id" column.
+    From stdin, JSON lines are detected and anything else is read as one
+    requirement per line. Malformed records and duplicate ids (which would
+    write to the same report) raise ValueError.
+    """
+    if path == "-":
+        text, is_csv = sys.stdin.read(), False
+    else:
+        text, is_csv = Path(path).read_text(encoding="utf-8"), path.lower().endswith(".csv")
+    strict = path.lower().endswith(".jsonl")
+    
+    if is_csv:
+        rows = list(csv.DictReader(io.StringIO(text)))
+        if rows and "requirement" not in rows[0]:
+            raise ValueError(f"{path}: CSV needs a 'requirement' column")
+        # Header is line 1
+        records = [(f"{path}:{number}", row) for number, row in enumerate(rows, start=2)]
+    else:
+        records = [
+            (f"{path}:{number}", _parse_line(line.strip(), f"{path}:{number}", strict))
+            for number, line in enumerate(text.splitlines(), start=1)
+            if line.strip()
+        ]
+    
+    items = [_item(index, record, where) for index, (where, record) in enumerate(records, start=1)]
+    items = [item for item in items if item["requirement"]]
+    
+    ids = Counter(item["id"] for item in items)
+    duplicates = sorted(item_id for item_id, count in ids.items() if count > 1)
+    if duplicates:
+        raise ValueError(f"{path}: duplicate ids {', '.join(duplicates)}; each id names its own report")
+    return items
+
+
+def _run_one(app, item: dict, mode: str) -> dict:
+    """Run one requirement; failures are recorded, not raised."""
+    thread_id = new_thread_id()
+    entry = {"id": item["id"], "requirement": item["requirement"], "thread_id": thread_id}
+    start = time.perf_counter()
+    try:
+        result = app.invoke(
+            GraphState(requirement=item["requirement"], report_id=item["id"]),
+            thread_config(thread_id)
+        )
+        entry.update(status="ok", title=result.get("title", ""))
+    except Exception as e:
+        entry.update(
+            status="error",
+            error=f"{type(e).__name__}: {e}"[:500],
+            resume=f"python main.py --resume {thread_id}" + (" --dag" if mode == "dag" else "")
+        )
+    entry["seconds"] = round(time.perf_counter() - start, 2)
+    return entry
+
+
+def run_batch(items: list, workers: int = None, mode: str = "sequential") -> list:
+    """Run every item through the pipeline, at most `workers` at a time.
+    
+    All workers share one compiled graph, the checkpoint database and the
+    per-provider rate limiters in Config. Results come back in input order.
+    """
+    workers = workers or Config.BATCH_WORKERS
+    results = [None] * len(items)
+    
+    with sqlite_checkpointer() as checkpointer:
+        app = create_workflow(checkpointer=checkpointer, mode=mode)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_run_one, app, item, mode): i for i, item in enumerate(items)}
+            for done, future in enumerate(as_completed(futures), start=1):
+                entry = future.result()
+                results[futures[future]] = entry
+                icon = "✅" if entry["status"] == "ok" else "❌"
+                print(f"{icon} [{done}/{len(items)}] {entry['id']}: {entry.get('title') or entry.get('error')}")
+    
+    return results
+
+
+def write_manifest(results: list, started_at: datetime, mode: str, workers: int, path: str = None) -> str:
+    """Write a JSON summary of a batch run (default: Outputs/batch_<time>.json); returns its path."""
+    for entry in results:
+        if entry["status"] == "ok":
+            entry["report"] = str(report_path(entry["title"], entry["id"]))
+    
+    path = Path(path or Path(Config.OUTPUT_DIR) / f"batch_{started_at:%Y%m%d_%H%M%S}.json")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "started_at": started_at.isoformat(timespec="seconds"),
+        "finished_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "mode": mode,
+        "workers": workers,
+        "total": len(results),
+        "succeeded": sum(entry["status"] == "ok" for entry in results),
+        "failed": sum(entry["status"] != "ok" for entry in results),
+        "items": results,
+    }
+    path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+    return str(path)
@@ -0,0 +1,119 @@
+"""Persistent response caches backed by SQLite"""
+
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from langchain_core.caches import BaseCache
+from langchain_core.outputs import ChatGeneration
+from langchain_core.messages import message_to_dict, messages_from_dict
+
+
+def _to_json(obj):
+    """json.dumps fallback for Pydantic objects (e.g. parsed structured output)"""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class SQLiteCache:
+    """JSON value cache with optional TTL and least-recently-used eviction"""
+    
+    def __init__(self, path: str, ttl: float | None = None, max_entries: int = 1000):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        
+        # One connection shared by batch worker threads, serialized by the lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed)")
+    
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Stable key from any JSON-serializable parts"""
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+    
+    def get(self, key: str):
+        """Return the cached value, or None on a miss or expired entry"""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, created FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            
+            if row is None or (self.ttl is not None and now - row[1] > self.ttl):
+                if row is not None:
+                    self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+            
+            self._conn.execute("UPDATE cache SET accessed = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return json.loads(row[0])
+    
+    def set(self, key: str, value) -> None:
+        """Store a value, then evict expired and least recently used entries"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, default=_to_json), now, now)
+            )
+            if self.ttl is not None:
+                self._conn.execute("DELETE FROM cache WHERE created < ?", (now - self.ttl,))
+            self._conn.execute(
+                "DELETE FROM cache WHERE key IN ("
+                "SELECT key FROM cache ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+    
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache")
+    
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+        }
+
+
+class SQLiteLLMCache(BaseCache):
+    """LangChain LLM cache that replays completions for identical requests
+    
+    LangChain keys lookups on the prompt plus an `llm_string` that encodes the
+    provider, model, temperature and other call parameters. Both are hashed
+    into the SQLite key, so any change to them is a miss.
+    """
+    
+    def __init__(self, path: str, max_entries: int = 1000, ttl: float | None = None):
+        self.store = SQLiteCache(path, ttl=ttl, max_entries=max_entries)
+    
+    def lookup(self, prompt: str, llm_string: str):
+        cached = self.store.get(SQLiteCache.make_key(llm_string, prompt))
+        if cached is None:
+            return None
+        return [ChatGeneration(message=message) for message in messages_from_dict(cached)]
+    
+    def update(self, prompt: str, llm_string: str, return_val) -> None:
+        messages = [message_to_dict(generation.message) for generation in return_val]
+        self.store.set(SQLiteCache.make_key(llm_string, prompt), messages)
+    
+    def clear(self, **kwargs) -> None:
+        self.store.clear()
@@ -0,0 +1,38 @@
+"""SQLite checkpoints, so a failed run can resume from its last completed node."""
+
+import uuid
+import sqlite3
+from pathlib import Path
+from contextlib import contextmanager, closing
+from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from src.config import Config
+
+# Pydantic models stored in GraphState and DAG tasks; the checkpoint reader only rebuilds listed types
+STATE_TYPES = [
+    ("src.models", name)
+    for name in (
+        "Constraint", "BusinessAnalysis", "Module", "ModuleDecomposition",
+        "SchemaField", "DataSchema", "DataSchemas", "PseudoCodeSection", "PseudoCode",
+        "ModuleTask", "WorkflowTask",
+    )
+]
+
+
+def new_thread_id() -> str:
+    """Create a short id for a new pipeline run."""
+    return uuid.uuid4().hex[:12]
+
+
+def thread_config(thread_id: str) -> dict:
+    """Build the LangGraph config that ties a run to its checkpoints."""
+    return {"configurable": {"thread_id": thread_id}}
+
+
+@contextmanager
+def sqlite_checkpointer(path: str = None):
+    """Open a SqliteSaver for create_workflow(checkpointer=...)."""
+    path = path or Config.CHECKPOINT_PATH
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with closing(sqlite3.connect(path, check_same_thread=False)) as conn:
+        yield SqliteSaver(conn, serde=JsonPlusSerializer(allowed_msgpack_modules=STATE_TYPES))
@@ -1,7 +1,12 @@
 import os
+import threading
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
 from langchain_groq import ChatGroq
+from langchain_core.caches import InMemoryCache
+from langchain_core.rate_limiters import InMemoryRateLimiter
+from src.cache import SQLiteLLMCache
+from src.instrumentation import TokenUsageHandler
 
 # Load environment variables
 load_dotenv()
@@ -24,20 +29,93 @@ class Config:
     # Output settings
     OUTPUT_DIR = "Outputs"
     
+    # Schema design runs one structured call per module, this many at a time
+    SCHEMA_MAX_CONCURRENCY = int(os.getenv("SCHEMA_MAX_CONCURRENCY", "4"))
+    
+    # Narrative report sections written by the LLM at once
+    SYNTHESIS_MAX_CONCURRENCY = int(os.getenv("SYNTHESIS_MAX_CONCURRENCY", "4"))
+    
+    # Artifacts above this many tokens (after pruning) are summarized before
+    # going into a prompt; 0 never summarizes
+    CONTEXT_SUMMARY_TOKENS = int(os.getenv("CONTEXT_SUMMARY_TOKENS", "0"))
+    
+    # Per-node timing/token records, appended as JSON lines after every run
+    METRICS_PATH = os.getenv("METRICS_PATH", ".cache/metrics.jsonl")
+    
+    # Runs save state after every node here; `main.py --resume THREAD_ID` continues a failed run
+    CHECKPOINT_PATH = os.getenv("CHECKPOINT_PATH", ".cache/checkpoints.sqlite")
+    
+    # LLM response cache: "sqlite" (persistent), "memory" (this process only) or "none"
+    LLM_CACHE = os.getenv("LLM_CACHE", "sqlite")
+    LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".cache/llm.sqlite")
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "2000"))
+    _llm_cache = None
+    
+    # Requests per second per provider, shared by all of its clients (and batch workers); 0 = unlimited
+    RATE_LIMITS = {
+        "openai": float(os.getenv("OPENAI_REQUESTS_PER_SECOND", "5")),
+        "groq": float(os.getenv("GROQ_REQUESTS_PER_SECOND", "0.5")),
+    }
+    _rate_limiters = {}
+    
+    # Batch mode (`main.py --batch FILE`): requirements processed at once
+    BATCH_WORKERS = int(os.getenv("BATCH_WORKERS", "4"))
+    
+    # Clients built by get_llm(), reused so nodes share connection pools
+    _llm_clients = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def get_llm_cache(cls):
+        """Get the shared LLM response cache, or None when caching is off."""
+        if cls._llm_cache is None:
+            if cls.LLM_CACHE == "sqlite":
+                cls._llm_cache = SQLiteLLMCache(cls.LLM_CACHE_PATH, max_entries=cls.LLM_CACHE_MAX_ENTRIES)
+            elif cls.LLM_CACHE == "memory":
+                cls._llm_cache = InMemoryCache(maxsize=cls.LLM_CACHE_MAX_ENTRIES)
+        return cls._llm_cache
+    
     @classmethod
     def get_llm(cls, temperature: float = 0.7):
-        """Get the configured LLM instance."""
+        """Get the configured LLM instance, shared per provider and temperature."""
+        key = (cls.PRIMARY_PROVIDER, temperature)
+        with cls._lock:
+            if key not in cls._llm_clients:
+                cls._llm_clients[key] = cls._create_llm(temperature)
+        return cls._llm_clients[key]
+    
+    @classmethod
+    def get_rate_limiter(cls, provider: str):
+        """Get the provider's shared rate limiter, or None when it is unlimited."""
+        rate = cls.RATE_LIMITS.get(provider, 0)
+        if rate <= 0:
+            return None
+        if provider not in cls._rate_limiters:
+            cls._rate_limiters[provider] = InMemoryRateLimiter(
+                requests_per_second=rate,
+                max_bucket_size=max(1, rate)
+            )
+        return cls._rate_limiters[provider]
+    
+    @classmethod
+    def _create_llm(cls, temperature: float):
         if cls.PRIMARY_PROVIDER == "openai":
             return ChatOpenAI(
                 model=cls.OPENAI_MODEL,
                 temperature=temperature,
-                api_key=cls.OPENAI_API_KEY
+                api_key=cls.OPENAI_API_KEY,
+                cache=cls.get_llm_cache(),
+                rate_limiter=cls.get_rate_limiter("openai"),
+                callbacks=[TokenUsageHandler()]
             )
         elif cls.PRIMARY_PROVIDER == "groq":
             return ChatGroq(
                 model=cls.GROQ_MODEL,
                 temperature=temperature,
-                api_key=cls.GROQ_API_KEY
+                api_key=cls.GROQ_API_KEY,
+                cache=cls.get_llm_cache(),
+                rate_limiter=cls.get_rate_limiter("groq"),
+                callbacks=[TokenUsageHandler()]
             )
         else:
             raise ValueError(f"Unknown provider: {cls.PRIMARY_PROVIDER}")
\ No newline at end of file
@@ -0,0 +1,183 @@
+"""Compact prompt context: minified, pruned artifacts and a token report per prompt.
+
+Each downstream node gets earlier artifacts as minified JSON with only the
+fields it uses (see PRUNE), instead of a full model_dump_json(indent=2).
+Artifacts still larger than Config.CONTEXT_SUMMARY_TOKENS are replaced by
+an LLM summary. Every prompt's size is recorded for print_report().
+"""
+
+import json
+import hashlib
+import threading
+from functools import lru_cache
+from src.config import Config
+from src.prompts import SUMMARIZE_CONTEXT_PROMPT
+
+try:
+    import tiktoken
+except ImportError:  # chars/4 is close enough for a report
+    tiktoken = None
+
+
+def _each(fields) -> dict:
+    """Include spec applying to every item of a list field."""
+    return {"__all__": fields}
+
+
+MODULE_OUTLINE = {"modules": _each({"name", "responsibility", "dependencies"})}
+SCHEMA_OUTLINE = {"schemas": _each({"entity": True, "fields": _each({"name", "type"}), "relationships": True})}
+
+# Fields each consumer reads, as pydantic include specs; missing artifacts are sent whole
+PRUNE = {
+    "decompose": {
+        "analysis": {"business_goal", "actors", "functional_expectations", "constraints"},
+    },
+    "schemas": {
+        "analysis": {"business_goal", "functional_expectations", "constraints"},
+        "modules": MODULE_OUTLINE,
+    },
+    "module_schemas": {
+        "analysis": {"business_goal", "functional_expectations"},
+    },
+    "pseudocode": {
+        "analysis": {"business_goal", "actors", "functional_expectations"},
+        "modules": MODULE_OUTLINE,
+        "schemas": SCHEMA_OUTLINE,
+    },
+    "workflow_pseudocode": {
+        "analysis": {"business_goal", "actors"},
+        "modules": MODULE_OUTLINE,
+    },
+    "data_flows": {
+        "modules": {"modules": _each({"name", "responsibility"})},
+        "schemas": SCHEMA_OUTLINE,
+    },
+    "synthesize.executive_summary": {
+        "analysis": {"business_goal", "actors", "functional_expectations"},
+        "modules": {"modules": _each({"name", "responsibility"})},
+    },
+    "synthesize.data_flow": {
+        "schemas": {"schemas": _each({"entity", "relationships"})},
+        "pseudocode": {"sections": _each({"name", "description"})},
+    },
+    "synthesize.recommendations": {
+        "analysis": {"functional_expectations", "constraints"},
+        "modules": {"modules": _each({"name", "tech_stack"})},
+        "schemas": {"schemas": _each({"entity", "indexes"})},
+    },
+}
+
+# consumer -> {"prompts", "tokens", "max_tokens", "saved_tokens"}
+REPORT = {}
+_lock = threading.Lock()
+_encoding_lock = threading.Lock()
+_summaries = {}
+
+
+def _encoding():
+    """tiktoken encoding for the model, or None (not installed, or offline on first use)."""
+    # Loaded once; concurrent first calls wait instead of each trying (and warning)
+    with _encoding_lock:
+        return _load_encoding()
+
+
+@lru_cache(maxsize=1)
+def _load_encoding():
+    if tiktoken is None:
+        return None
+    try:
+        name = tiktoken.encoding_name_for_model(Config.OPENAI_MODEL)
+    except KeyError:
+        name = "cl100k_base"
+    try:
+        return tiktoken.get_encoding(name)
+    except Exception as e:
+        print(f"⚠️  tiktoken unavailable ({type(e).__name__}), estimating tokens as chars/4")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Token count with tiktoken when available, otherwise about chars/4."""
+    encoding = _encoding()
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text))
+
+
+def _without_empty(value):
+    """Drop empty strings and lists; they cost tokens and say nothing."""
+    if isinstance(value, dict):
+        return {k: _without_empty(v) for k, v in value.items() if v not in ("", [], None)}
+    if isinstance(value, list):
+        return [_without_empty(v) for v in value]
+    return value
+
+
+def _report(consumer: str, **counts) -> dict:
+    row = REPORT.setdefault(consumer, {"prompts": 0, "tokens": 0, "max_tokens": 0, "saved_tokens": 0})
+    for key, value in counts.items():
+        row[key] += value
+    return row
+
+
+def _summarize(name: str, consumer: str, text: str) -> str:
+    """LLM summary of an oversized artifact, cached for the process."""
+    key = hashlib.sha256(f"{consumer}\0{text}".encode()).hexdigest()
+    if key not in _summaries:
+        print(f"   🗜️  Summarizing {name} for {consumer}")
+        response = Config.get_llm(temperature=0).invoke(
+            SUMMARIZE_CONTEXT_PROMPT.format(name=name, limit=Config.CONTEXT_SUMMARY_TOKENS, artifact=text)
+        )
+        _summaries[key] = response.content.strip()
+    return _summaries[key]
+
+
+def encode(name: str, artifact, consumer: str) -> str:
+    """Compact prompt text for an artifact, pruned to what consumer reads."""
+    if artifact is None:
+        return "{}"
+    include = PRUNE.get(consumer, {}).get(name)
+    text = json.dumps(
+        _without_empty(artifact.model_dump(include=include)),
+        separators=(",", ":"),
+        ensure_ascii=False
+    )
+    
+    if Config.CONTEXT_SUMMARY_TOKENS and count_tokens(text) > Config.CONTEXT_SUMMARY_TOKENS:
+        text = _summarize(name, consumer, text)
+    
+    saved = count_tokens(artifact.model_dump_json(indent=2)) - count_tokens(text)
+    with _lock:
+        _report(consumer, saved_tokens=saved)
+    return text
+
+
+def log_prompt(consumer: str, prompt: str) -> str:
+    """Record the prompt's token count under consumer and return the prompt."""
+    tokens = count_tokens(prompt)
+    with _lock:
+        row = _report(consumer, prompts=1, tokens=tokens)
+        row["max_tokens"] = max(row["max_tokens"], tokens)
+    return prompt
+
+
+def print_report() -> None:
+    """Print prompt tokens per consumer, and what compaction saved."""
+    if not REPORT:
+        return
+    
+    counter = "tiktoken" if _encoding() is not None else "chars/4"
+    header = f"{'prompt':<30}{'calls':>6}{'tokens':>9}{'max':>8}{'saved':>9}"
+    print(f"\n🧮 Prompt tokens ({counter})")
+    print(header)
+    print("-" * len(header))
+    for consumer, row in REPORT.items():
+        print(
+            f"{consumer:<30}{row['prompts']:>6}{row['tokens']:>9}{row['max_tokens']:>8}{row['saved_tokens']:>9}"
+        )
+    print("-" * len(header))
+    print(
+        f"{'total':<30}{sum(r['prompts'] for r in REPORT.values()):>6}"
+        f"{sum(r['tokens'] for r in REPORT.values()):>9}{'':>8}"
+        f"{sum(r['saved_tokens'] for r in REPORT.values()):>9}"
+    )
@@ -1,36 +1,93 @@
 from langgraph.graph import StateGraph, END
-from src.models import GraphState
+from langgraph.types import Send
+from src.models import GraphState, ModuleTask, WorkflowTask
+from src.instrumentation import instrument
 from src.nodes import (
     analyze_requirements,
     decompose_modules,
     design_schemas,
+    design_module_schemas,
     generate_pseudocode,
+    generate_workflow_pseudocode,
+    generate_data_flow_pseudocode,
     synthesize_report
 )
 
+MODES = ("sequential", "dag")
 
-def create_workflow():
-    """Create the LangGraph workflow for requirement conversion."""
+
+def fan_out_design(state: GraphState):
+    """Start one schema task per module and one pseudo-code task per workflow."""
+    sends = [
+        Send("module_schemas", ModuleTask(analysis=state.analysis, modules=state.modules, module=module))
+        for module in state.modules.modules
+    ]
+    sends += [
+        Send("workflow_pseudocode", WorkflowTask(analysis=state.analysis, modules=state.modules, workflow=workflow))
+        for workflow in state.analysis.functional_expectations
+    ]
+    return sends or "data_flows"
+
+
+def _add_sequential_flow(workflow: StateGraph):
+    """analyze -> decompose -> schemas -> pseudocode -> synthesize, one stage at a time."""
+    workflow.add_node("schemas", instrument(design_schemas, "schemas"))
+    workflow.add_node("pseudocode", instrument(generate_pseudocode, "pseudocode"))
+    
+    workflow.add_edge("decompose", "schemas")
+    workflow.add_edge("schemas", "pseudocode")
+    workflow.add_edge("pseudocode", "synthesize")
+
+
+def _add_dag_flow(workflow: StateGraph):
+    """Fan out after decompose; latency follows the critical path, not the sum of stages.
+    
+    Per-module schemas and per-workflow pseudo-code run in parallel, data flow
+    pseudo-code waits for the merged schemas, then synthesis.
+    """
+    workflow.add_node("module_schemas", instrument(design_module_schemas, "module_schemas"), input_schema=ModuleTask)
+    workflow.add_node(
+        "workflow_pseudocode",
+        instrument(generate_workflow_pseudocode, "workflow_pseudocode"),
+        input_schema=WorkflowTask
+    )
+    workflow.add_node("data_flows", instrument(generate_data_flow_pseudocode, "data_flows"))
+    
+    workflow.add_conditional_edges("decompose", fan_out_design, ["module_schemas", "workflow_pseudocode", "data_flows"])
+    # Both fan-outs finish in the same step, so data_flows runs once, after all of them
+    workflow.add_edge("module_schemas", "data_flows")
+    workflow.add_edge("workflow_pseudocode", "data_flows")
+    workflow.add_edge("data_flows", "synthesize")
+
+
+def create_workflow(checkpointer=None, mode: str = "sequential"):
+    """Create the LangGraph workflow for requirement conversion.
+    
+    mode="dag" runs independent sub-tasks in parallel (see _add_dag_flow).
+    With a checkpointer, state is saved after every node under the run's
+    thread_id, and invoking again with that thread_id resumes a failed run.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown workflow mode: {mode} (expected one of {', '.join(MODES)})")
     
     # Initialize the graph
     workflow = StateGraph(GraphState)
     
-    # Add nodes
-    workflow.add_node("analyze", analyze_requirements)
-    workflow.add_node("decompose", decompose_modules)
-    workflow.add_node("schemas", design_schemas)
-    workflow.add_node("pseudocode", generate_pseudocode)
-    workflow.add_node("synthesize", synthesize_report)
+    # Add nodes (instrumented: timings and token usage land in the metrics table)
+    workflow.add_node("analyze", instrument(analyze_requirements, "analyze"))
+    workflow.add_node("decompose", instrument(decompose_modules, "decompose"))
+    workflow.add_node("synthesize", instrument(synthesize_report, "synthesize"))
     
     # Define the flow
     workflow.set_entry_point("analyze")
     workflow.add_edge("analyze", "decompose")
-    workflow.add_edge("decompose", "schemas")
-    workflow.add_edge("schemas", "pseudocode")
-    workflow.add_edge("pseudocode", "synthesize")
+    if mode == "dag":
+        _add_dag_flow(workflow)
+    else:
+        _add_sequential_flow(workflow)
     workflow.add_edge("synthesize", END)
     
     # Compile the graph
-    app = workflow.compile()
+    app = workflow.compile(checkpointer=checkpointer)
     
-    return app
\ No newline at end of file
+    return app
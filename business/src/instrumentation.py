@@ -0,0 +1,181 @@
+"""Per-node metrics: wall time, retries, LLM token usage and payload sizes.
+
+Nodes are wrapped with instrument() when the graph is built. Each call adds
+one record to RECORDS; LLM calls made while the node runs are attributed to
+it through a context variable, which LangGraph and LangChain carry into
+worker threads.
+"""
+
+import json
+import time
+import threading
+import functools
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from langchain_core.callbacks import BaseCallbackHandler
+
+RECORDS = []
+_lock = threading.Lock()
+_current = ContextVar("current_node_record", default=None)
+
+
+def _payload_size(obj) -> int:
+    """Size in bytes of a state or state update, as JSON."""
+    if obj is None:
+        return 0
+    if hasattr(obj, "model_dump_json"):
+        return len(obj.model_dump_json().encode())
+    return len(json.dumps(obj, default=str).encode())
+
+
+def _new_record(name: str, state) -> dict:
+    return {
+        "node": name,
+        "started_at": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+        "wall_time": 0.0,
+        "status": "ok",
+        "retries": 0,
+        "llm_calls": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "cache_hits": 0,
+        "cached_tokens": 0,
+        "input_bytes": _payload_size(state),
+        "output_bytes": 0,
+    }
+
+
+def _finish(record: dict, start: float, result=None, error=None):
+    record["wall_time"] = round(time.perf_counter() - start, 4)
+    if error is not None:
+        record["status"] = "error"
+        record["error"] = f"{type(error).__name__}: {error}"[:200]
+    else:
+        record["output_bytes"] = _payload_size(result)
+    with _lock:
+        RECORDS.append(record)
+
+
+def instrument(node, name: str | None = None):
+    """Wrap a graph node so every call is recorded."""
+    name = name or node.__name__
+    
+    @functools.wraps(node)
+    def wrapper(state, *args, **kwargs):
+        record = _new_record(name, state)
+        token = _current.set(record)
+        start = time.perf_counter()
+        try:
+            result = node(state, *args, **kwargs)
+        except Exception as e:
+            _finish(record, start, error=e)
+            raise
+        finally:
+            _current.reset(token)
+        _finish(record, start, result)
+        return result
+    return wrapper
+
+
+def record_retry() -> None:
+    """Count a retry against the node that is currently running."""
+    record = _current.get()
+    if record is not None:
+        record["retries"] += 1
+
+
+class TokenUsageHandler(BaseCallbackHandler):
+    """LLM callback adding token usage to the running node's record.
+    
+    Answers replayed from the LLM cache are counted as cache_hits/cached_tokens,
+    not as billed llm_calls/prompt_tokens/completion_tokens.
+    """
+    
+    def on_llm_end(self, response, **kwargs) -> None:
+        record = _current.get()
+        if record is None:
+            return
+        
+        prompt_tokens = completion_tokens = 0
+        cached = False
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if usage:
+                    # LangChain keeps the usage of a cache hit but zeroes its cost
+                    cached = cached or usage.get("total_cost") == 0
+                    prompt_tokens += usage.get("input_tokens", 0)
+                    completion_tokens += usage.get("output_tokens", 0)
+        
+        # Older integrations only report usage in llm_output
+        if not (prompt_tokens or completion_tokens):
+            usage = (response.llm_output or {}).get("token_usage") or {}
+            prompt_tokens = usage.get("prompt_tokens", 0)
+            completion_tokens = usage.get("completion_tokens", 0)
+        
+        with _lock:
+            if cached:
+                record["cache_hits"] += 1
+                record["cached_tokens"] += prompt_tokens + completion_tokens
+                return
+            record["llm_calls"] += 1
+            record["prompt_tokens"] += prompt_tokens
+            record["completion_tokens"] += completion_tokens
+
+
+def export_jsonl(path: str) -> None:
+    """Append this process's records to a JSON lines file."""
+    if not RECORDS:
+        return
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        for record in RECORDS:
+            f.write(json.dumps(record) + "\n")
+
+
+def summarize() -> list:
+    """Aggregate records per node, in order of first appearance."""
+    rows = {}
+    for record in RECORDS:
+        row = rows.setdefault(record["node"], {
+            "node": record["node"], "calls": 0, "errors": 0, "wall_time": 0.0, "max_time": 0.0,
+            "retries": 0, "llm_calls": 0, "prompt_tokens": 0, "completion_tokens": 0,
+            "cache_hits": 0, "cached_tokens": 0, "input_bytes": 0, "output_bytes": 0,
+        })
+        row["calls"] += 1
+        row["errors"] += record["status"] == "error"
+        row["max_time"] = max(row["max_time"], record["wall_time"])
+        for key in ("wall_time", "retries", "llm_calls", "prompt_tokens", "completion_tokens",
+                    "cache_hits", "cached_tokens", "input_bytes", "output_bytes"):
+            row[key] += record[key]
+    return list(rows.values())
+
+
+def print_summary() -> None:
+    """Print a per-node table of time, retries, tokens and payload sizes."""
+    rows = summarize()
+    if not rows:
+        return
+    
+    header = f"{'node':<20}{'calls':>6}{'total s':>9}{'max s':>8}{'retry':>6}{'llm':>5}{'tok in':>8}{'tok out':>8}{'cached':>7}{'KB in':>8}{'KB out':>8}"
+    print("\n📊 Node metrics")
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        errors = f" ({row['errors']} failed)" if row["errors"] else ""
+        print(
+            f"{row['node']:<20}{row['calls']:>6}{row['wall_time']:>9.2f}{row['max_time']:>8.2f}"
+            f"{row['retries']:>6}{row['llm_calls']:>5}{row['prompt_tokens']:>8}{row['completion_tokens']:>8}"
+            f"{row['cache_hits']:>7}{row['input_bytes'] / 1024:>8.1f}{row['output_bytes'] / 1024:>8.1f}{errors}"
+        )
+    print("-" * len(header))
+    print(
+        f"{'total':<20}{sum(r['calls'] for r in rows):>6}{sum(r['wall_time'] for r in rows):>9.2f}{'':>8}"
+        f"{sum(r['retries'] for r in rows):>6}{sum(r['llm_calls'] for r in rows):>5}"
+        f"{sum(r['prompt_tokens'] for r in rows):>8}{sum(r['completion_tokens'] for r in rows):>8}"
+        f"{sum(r['cache_hits'] for r in rows):>7}"
+    )
+    cached_tokens = sum(r["cached_tokens"] for r in rows)
+    if cached_tokens:
+        print(f"{cached_tokens} tokens served from the LLM cache (not billed)")
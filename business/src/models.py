@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Annotated
 
 
 class Constraint(BaseModel):
@@ -67,16 +67,99 @@ class TechnicalSpecification(BaseModel):
     markdown_content: str = Field(description="Complete specification in Markdown format")
 
 
+def _key(name: str) -> str:
+    """Normalize an entity or field name ("Order Items" and "order_items" are the same)."""
+    return "_".join(name.lower().replace("-", " ").split())
+
+
+def _union(left: List[str], right: List[str]) -> List[str]:
+    return list(dict.fromkeys(left + right))
+
+
+def merge_entity(left: DataSchema, right: DataSchema) -> DataSchema:
+    """Combine two definitions of one entity: union of fields, relationships and indexes.
+    
+    Fields are matched by name; the first definition of a field wins.
+    """
+    fields = {}
+    for field in left.fields + right.fields:
+        fields.setdefault(_key(field.name), field)
+    return DataSchema(
+        entity=left.entity,
+        fields=list(fields.values()),
+        relationships=_union(left.relationships, right.relationships),
+        indexes=_union(left.indexes, right.indexes)
+    )
+
+
+def merge_schemas(left: DataSchemas | None, right: DataSchemas | None) -> DataSchemas | None:
+    """Reducer for GraphState.schemas: combine schemas written by parallel nodes.
+    
+    Entities with the same name are merged with merge_entity, so merging
+    the same schemas twice is a no-op.
+    """
+    if left is None or right is None:
+        return right if left is None else left
+    merged = {}
+    for schema in left.schemas + right.schemas:
+        key = _key(schema.entity)
+        merged[key] = merge_entity(merged[key], schema) if key in merged else schema
+    return DataSchemas(schemas=list(merged.values()))
+
+
+def merge_pseudocode(left: PseudoCode | None, right: PseudoCode | None) -> PseudoCode | None:
+    """Reducer for GraphState.pseudocode: append sections written by parallel nodes.
+    
+    A repeated section (same name and content) is kept once. A different
+    section that reuses a name is kept as "<name> (2)", so two workflows the
+    LLM happened to name alike can't overwrite each other.
+    """
+    if left is None or right is None:
+        return right if left is None else left
+    sections = list(left.sections)
+    names = {_key(section.name) for section in sections}
+    for section in right.sections:
+        if section in sections:
+            continue
+        name, n = section.name, 1
+        while _key(name) in names:
+            n += 1
+            name = f"{section.name} ({n})"
+        names.add(_key(name))
+        sections.append(section if n == 1 else section.model_copy(update={"name": name}))
+    return PseudoCode(sections=sections)
+
+
 # Separate state class without structured output constraints
 class GraphState(BaseModel):
-    """State object passed through the LangGraph workflow."""
+    """State object passed through the LangGraph workflow.
+    
+    schemas and pseudocode have merge reducers, so in DAG mode several
+    nodes can add to them in the same step.
+    """
     requirement: str
     title: str = ""
     analysis: BusinessAnalysis | None = None
     modules: ModuleDecomposition | None = None
-    schemas: DataSchemas | None = None
-    pseudocode: PseudoCode | None = None
+    schemas: Annotated[DataSchemas | None, merge_schemas] = None
+    pseudocode: Annotated[PseudoCode | None, merge_pseudocode] = None
     final_report: str = ""
+    # Batch mode: appended to the output folder, so specs with the same title don't overwrite each other
+    report_id: str = ""
     
     class Config:
-        arbitrary_types_allowed = True
\ No newline at end of file
+        arbitrary_types_allowed = True
+
+
+class ModuleTask(BaseModel):
+    """DAG mode input for designing the schemas of one module."""
+    analysis: BusinessAnalysis
+    modules: ModuleDecomposition
+    module: Module
+
+
+class WorkflowTask(BaseModel):
+    """DAG mode input for writing the pseudo-code of one workflow."""
+    analysis: BusinessAnalysis
+    modules: ModuleDecomposition
+    workflow: str
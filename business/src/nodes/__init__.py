@@ -1,13 +1,16 @@
 from .analyze import analyze_requirements
 from .decompose import decompose_modules
-from .schemas import design_schemas
-from .pseudocode import generate_pseudocode
+from .schemas import design_schemas, design_module_schemas
+from .pseudocode import generate_pseudocode, generate_workflow_pseudocode, generate_data_flow_pseudocode
 from .synthesize import synthesize_report
 
 __all__ = [
     "analyze_requirements",
     "decompose_modules",
     "design_schemas",
+    "design_module_schemas",
     "generate_pseudocode",
+    "generate_workflow_pseudocode",
+    "generate_data_flow_pseudocode",
     "synthesize_report"
 ]
\ No newline at end of file
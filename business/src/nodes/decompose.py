@@ -1,6 +1,7 @@
 from src.models import GraphState, ModuleDecomposition
 from src.config import Config
 from src.prompts import DECOMPOSE_PROMPT
+from src.context import encode, log_prompt
 
 
 def decompose_modules(state: GraphState) -> GraphState:
@@ -21,11 +22,9 @@ def decompose_modules(state: GraphState) -> GraphState:
     structured_llm = llm.with_structured_output(ModuleDecomposition)
     
     # Generate modules
-    modules = structured_llm.invoke(
-        DECOMPOSE_PROMPT.format(
-            analysis=state.analysis.model_dump_json(indent=2)
-        )
-    )
+    modules = structured_llm.invoke(log_prompt("decompose", DECOMPOSE_PROMPT.format(
+        analysis=encode("analysis", state.analysis, "decompose")
+    )))
     
     # Update state
     state.modules = modules
@@ -1,6 +1,7 @@
-from src.models import GraphState, PseudoCode
+from src.models import GraphState, PseudoCode, PseudoCodeSection, WorkflowTask
 from src.config import Config
-from src.prompts import PSEUDOCODE_PROMPT
+from src.prompts import PSEUDOCODE_PROMPT, WORKFLOW_PSEUDOCODE_PROMPT, DATA_FLOW_PSEUDOCODE_PROMPT
+from src.context import encode, log_prompt
 
 
 def generate_pseudocode(state: GraphState) -> GraphState:
@@ -20,16 +21,57 @@ def generate_pseudocode(state: GraphState) -> GraphState:
     structured_llm = llm.with_structured_output(PseudoCode)
     
     # Generate pseudo-code
-    pseudocode = structured_llm.invoke(
-        PSEUDOCODE_PROMPT.format(
-            analysis=state.analysis.model_dump_json(indent=2),
-            modules=state.modules.model_dump_json(indent=2),
-            schemas=state.schemas.model_dump_json(indent=2)
-        )
-    )
+    pseudocode = structured_llm.invoke(log_prompt("pseudocode", PSEUDOCODE_PROMPT.format(
+        analysis=encode("analysis", state.analysis, "pseudocode"),
+        modules=encode("modules", state.modules, "pseudocode"),
+        schemas=encode("schemas", state.schemas, "pseudocode")
+    )))
     
     # Update state
     state.pseudocode = pseudocode
     
     print(f"✅ Generated {len(pseudocode.sections)} pseudo-code sections")
-    return state
\ No newline at end of file
+    return state
+
+
+def generate_workflow_pseudocode(task: WorkflowTask) -> dict:
+    """
+    DAG node: Generate pseudo-code for a single workflow.
+    
+    User workflows only need the analysis and modules, so these run in
+    parallel with schema design.
+    """
+    print(f"💻 Generating pseudo-code for workflow: {task.workflow}")
+    
+    llm = Config.get_llm(temperature=0.6)
+    structured_llm = llm.with_structured_output(PseudoCodeSection)
+    
+    section = structured_llm.invoke(log_prompt("workflow_pseudocode", WORKFLOW_PSEUDOCODE_PROMPT.format(
+        analysis=encode("analysis", task.analysis, "workflow_pseudocode"),
+        modules=encode("modules", task.modules, "workflow_pseudocode"),
+        workflow=task.workflow
+    )))
+    
+    print(f"✅ Generated pseudo-code section: {section.name}")
+    return {"pseudocode": PseudoCode(sections=[section])}
+
+
+def generate_data_flow_pseudocode(state: GraphState) -> dict:
+    """
+    DAG node: Generate pseudo-code for data processing flows.
+    
+    The only pseudo-code that needs the schemas, so it runs once every
+    module's schemas are merged.
+    """
+    print("💻 Generating data flow pseudo-code...")
+    
+    llm = Config.get_llm(temperature=0.6)
+    structured_llm = llm.with_structured_output(PseudoCode)
+    
+    pseudocode = structured_llm.invoke(log_prompt("data_flows", DATA_FLOW_PSEUDOCODE_PROMPT.format(
+        modules=encode("modules", state.modules, "data_flows"),
+        schemas=encode("schemas", state.schemas, "data_flows")
+    )))
+    
+    print(f"✅ Generated {len(pseudocode.sections)} data flow sections")
+    return {"pseudocode": pseudocode}
@@ -1,12 +1,27 @@
-from src.models import GraphState, DataSchemas
+from functools import reduce
+from src.models import GraphState, DataSchemas, ModuleTask, merge_schemas
 from src.config import Config
-from src.prompts import SCHEMA_PROMPT
+from src.prompts import SCHEMA_PROMPT, MODULE_SCHEMA_PROMPT
+from src.context import encode, log_prompt
+
+
+def _module_schema_prompt(task: ModuleTask) -> str:
+    return log_prompt("module_schemas", MODULE_SCHEMA_PROMPT.format(
+        analysis=encode("analysis", task.analysis, "module_schemas"),
+        module_names=", ".join(module.name for module in task.modules.modules),
+        module=encode("module", task.module, "module_schemas")
+    ))
 
 
 def design_schemas(state: GraphState) -> GraphState:
     """
     Node 3: Design data schemas for the system.
     
+    Map: one structured call per module, run concurrently (at most
+    Config.SCHEMA_MAX_CONCURRENCY at a time), so each generation stays short.
+    Reduce: entities designed by several modules are merged into one, with
+    their fields, relationships and indexes combined.
+    
     Generates:
     - Entity/table definitions
     - Field specifications
@@ -20,16 +35,45 @@ def design_schemas(state: GraphState) -> GraphState:
     # Use structured output
     structured_llm = llm.with_structured_output(DataSchemas)
     
-    # Generate schemas
-    schemas = structured_llm.invoke(
-        SCHEMA_PROMPT.format(
-            analysis=state.analysis.model_dump_json(indent=2),
-            modules=state.modules.model_dump_json(indent=2)
+    modules = state.modules.modules
+    if not modules:
+        # Nothing to map over, design the whole system at once
+        schemas = structured_llm.invoke(log_prompt("schemas", SCHEMA_PROMPT.format(
+            analysis=encode("analysis", state.analysis, "schemas"),
+            modules=encode("modules", state.modules, "schemas")
+        )))
+    else:
+        # Map: schemas per module
+        tasks = [ModuleTask(analysis=state.analysis, modules=state.modules, module=module) for module in modules]
+        results = structured_llm.batch(
+            [_module_schema_prompt(task) for task in tasks],
+            config={"max_concurrency": Config.SCHEMA_MAX_CONCURRENCY}
         )
-    )
+        for module, result in zip(modules, results):
+            print(f"   {module.name}: {len(result.schemas)} data schemas")
+        
+        # Reduce: deduplicate entities across modules
+        schemas = reduce(merge_schemas, results, DataSchemas(schemas=[]))
     
     # Update state
     state.schemas = schemas
     
     print(f"✅ Designed {len(schemas.schemas)} data schemas")
-    return state
\ No newline at end of file
+    return state
+
+
+def design_module_schemas(task: ModuleTask) -> dict:
+    """
+    DAG node: Design the data schemas owned by a single module.
+    
+    Runs once per module, in parallel; GraphState.schemas merges the results.
+    """
+    print(f"🗄️  Designing schemas for module: {task.module.name}")
+    
+    llm = Config.get_llm(temperature=0.4)
+    structured_llm = llm.with_structured_output(DataSchemas)
+    
+    schemas = structured_llm.invoke(_module_schema_prompt(task))
+    
+    print(f"✅ {task.module.name}: {len(schemas.schemas)} data schemas")
+    return {"schemas": schemas}
@@ -1,13 +1,67 @@
-from src.models import GraphState, TechnicalSpecification
+from src.models import GraphState
 from src.config import Config
-from src.prompts import SYNTHESIZE_PROMPT
-from src.utils import save_report
+from src.prompts import SECTION_PROMPT, SECTION_INSTRUCTIONS
+from src.render import (
+    render_business_analysis,
+    render_module_overview,
+    render_module_dependencies,
+    render_data_schemas,
+    render_pseudocode
+)
+from src.utils import ReportWriter
+from src.context import encode, log_prompt
+
+# Artifacts a written section can be given, with their labels in the prompt
+CONTEXT_LABELS = {
+    "analysis": "Business Analysis",
+    "modules": "System Modules",
+    "schemas": "Data Schemas",
+    "pseudocode": "Pseudo-code",
+}
+
+# Report parts in document order. Everything that restates the models is rendered
+# from them; only narrative sections are written by the LLM, from the artifacts they need.
+REPORT_PARTS = [
+    {"heading": "## 1. Executive Summary", "write": "executive_summary", "context": ["analysis", "modules"]},
+    {"heading": "## 2. Business Requirement Analysis", "render": lambda state: render_business_analysis(state.analysis)},
+    {"heading": "## 3. System Architecture\n\n### Module Overview", "render": lambda state: render_module_overview(state.modules)},
+    {"heading": "### Module Dependencies", "render": lambda state: render_module_dependencies(state.modules)},
+    {"heading": "## 4. Data Architecture\n\n### Data Schemas", "render": lambda state: render_data_schemas(state.schemas)},
+    {"heading": "### Data Flow", "write": "data_flow", "context": ["schemas", "pseudocode"]},
+    {"heading": "## 5. Implementation Logic", "render": lambda state: render_pseudocode(state.pseudocode)},
+    {"heading": "## 6. Technical Recommendations", "write": "recommendations", "context": ["analysis", "modules", "schemas"]},
+]
+
+
+def _section_name(part: dict) -> str:
+    """Innermost heading of a part, without the Markdown markers."""
+    return part["heading"].split("\n")[-1].lstrip("# ")
+
+
+def _section_prompt(state: GraphState, part: dict) -> str:
+    consumer = f"synthesize.{part['write']}"
+    context = "\n\n".join(
+        f"{CONTEXT_LABELS[key]}:\n{encode(key, getattr(state, key), consumer)}"
+        for key in part["context"]
+        if getattr(state, key) is not None
+    )
+    return log_prompt(consumer, SECTION_PROMPT.format(
+        title=state.title,
+        requirement=state.requirement,
+        context=context,
+        heading=_section_name(part),
+        instructions=SECTION_INSTRUCTIONS[part["write"]]
+    ))
 
 
 def synthesize_report(state: GraphState) -> GraphState:
     """
     Node 5: Synthesize all information into a comprehensive Markdown report.
     
+    Analysis, modules, schemas and pseudo-code are rendered from the models;
+    the narrative sections are written concurrently by the LLM. Each part is streamed to
+    the report file as soon as it and everything before it are done.
+    
     Generates:
     - Well-formatted technical specification
     - Saves to Outputs folder
@@ -16,25 +70,26 @@ def synthesize_report(state: GraphState) -> GraphState:
     
     llm = Config.get_llm(temperature=0.3)
     
-    # Use structured output
-    structured_llm = llm.with_structured_output(TechnicalSpecification)
-    
-    # Generate final report
-    spec = structured_llm.invoke(
-        SYNTHESIZE_PROMPT.format(
-            requirement=state.requirement,
-            analysis=state.analysis.model_dump_json(indent=2),
-            modules=state.modules.model_dump_json(indent=2),
-            schemas=state.schemas.model_dump_json(indent=2),
-            pseudocode=state.pseudocode.model_dump_json(indent=2)
-        )
-    )
-    
-    # Update state
-    state.final_report = spec.markdown_content
-    
-    # Save to file
-    report_path = save_report(state.title, spec.markdown_content)
+    with ReportWriter(state.title, len(REPORT_PARTS) + 1, state.report_id) as writer:
+        writer.set(0, f"# Technical Specification: {state.title}")
+        
+        # Rendered parts are ready immediately
+        written = []
+        for index, part in enumerate(REPORT_PARTS, start=1):
+            if "render" in part:
+                writer.set(index, f"{part['heading']}\n\n{part['render'](state)}")
+            else:
+                written.append((index, part))
+        
+        # Narrative sections, in whatever order they finish
+        prompts = [_section_prompt(state, part) for _, part in written]
+        for i, response in llm.batch_as_completed(prompts, config={"max_concurrency": Config.SYNTHESIS_MAX_CONCURRENCY}):
+            index, part = written[i]
+            writer.set(index, f"{part['heading']}\n\n{response.content.strip()}")
+            print(f"   ✍️  {_section_name(part)}")
+        
+        # Update state
+        state.final_report = writer.close()
     
-    print(f"✅ Report saved to: {report_path}")
-    return state
\ No newline at end of file
+    print(f"✅ Report saved to: {writer.path}")
+    return state
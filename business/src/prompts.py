@@ -138,4 +138,94 @@ Format requirements:
 - Make it visually clear and easy to scan
 - Include all details from the provided information
 
-Create a comprehensive, production-ready technical specification document."""
\ No newline at end of file
+Create a comprehensive, production-ready technical specification document."""
+
+# DAG mode: smaller prompts, each needing only its own inputs
+
+MODULE_SCHEMA_PROMPT = """You are a database architect. Design the data schemas owned by one module of a larger system.
+
+System Context:
+Analysis: {analysis}
+All modules: {module_names}
+
+Module to design:
+{module}
+
+Design only the entities this module owns:
+- Entity/Table names
+- Fields with appropriate data types and constraints
+- Relationships with other entities, including entities owned by other modules (one-to-many, many-to-many, etc.)
+- Recommended indexes for performance
+
+Do not redefine entities that clearly belong to another module; reference them in relationships instead.
+Return an empty list if the module stores no data."""
+
+
+WORKFLOW_PSEUDOCODE_PROMPT = """You are a technical architect. Write pseudo-code for one workflow of the system.
+
+System Design:
+Analysis: {analysis}
+Modules: {modules}
+
+Workflow:
+{workflow}
+
+Write clear, language-agnostic pseudo-code that:
+- Shows how users and modules interact, step by step
+- Covers the core business logic (algorithms, decision-making)
+- Includes error handling considerations
+- References the modules where applicable
+
+Give the section a short name and a one-sentence description."""
+
+
+DATA_FLOW_PSEUDOCODE_PROMPT = """You are a technical architect. Based on the system design, generate pseudo-code for the data processing flows.
+
+System Design:
+Modules: {modules}
+Schemas: {schemas}
+
+Generate clear, language-agnostic pseudo-code for how data moves through the system:
+ingestion, validation, transformation, storage and background processing.
+
+Each section should:
+- Have a clear name and description
+- Show step-by-step logic
+- Include error handling considerations
+- Reference the modules and schemas where applicable
+
+User-facing workflows are covered separately; focus on data processing only."""
+
+
+# Sectioned synthesis: each narrative section of the spec is its own call
+
+SECTION_PROMPT = """You are a technical documentation expert writing one section of a technical specification in Markdown.
+
+Project: {title}
+Original Requirement: {requirement}
+
+{context}
+
+Write the content of the section "{heading}":
+{instructions}
+
+Format requirements:
+- Do not repeat the section heading; start directly with the content
+- Use sub-headings one level below the section heading
+- Use bullet points, numbered lists and code blocks (```sql, ```python, etc.) where appropriate
+- Be specific to this system and consistent with the provided design"""
+
+
+SECTION_INSTRUCTIONS = {
+    "executive_summary": "A brief overview of the requirement and the proposed solution (one or two paragraphs).",
+    "data_flow": "How data moves through the system: sources, processing steps, storage and consumers, referencing the entities above.",
+    "recommendations": "Key technical considerations for implementation: scaling, security, observability, testing and rollout, tied to the constraints above.",
+}
+
+
+SUMMARIZE_CONTEXT_PROMPT = """Condense the following {name} (JSON) for use as context in another prompt.
+
+Keep every name (entities, modules, fields, workflows) and every fact a developer would need; drop wording, repetition and formatting.
+Answer in at most {limit} tokens of plain text.
+
+{artifact}"""
@@ -0,0 +1,105 @@
+"""Markdown rendering of spec artifacts that need no LLM.
+
+Everything here is a straight re-serialization of the Pydantic models:
+analysis, module and schema tables, pseudo-code. Only narrative sections
+of the report go to the LLM.
+"""
+
+from src.models import BusinessAnalysis, ModuleDecomposition, DataSchemas, PseudoCode
+
+
+def _cell(value) -> str:
+    """Escape a value for a Markdown table cell."""
+    text = ", ".join(value) if isinstance(value, list) else str(value)
+    return " ".join(text.replace("|", "\\|").split()) or "-"
+
+
+def table(headers: list, rows: list) -> str:
+    """Render a Markdown table."""
+    lines = [
+        "| " + " | ".join(headers) + " |",
+        "|" + "|".join("---" for _ in headers) + "|",
+    ]
+    lines += ["| " + " | ".join(_cell(value) for value in row) + " |" for row in rows]
+    return "\n".join(lines)
+
+
+def _bullets(items: list) -> str:
+    return "\n".join(f"- {item}" for item in items) or "- None identified"
+
+
+def render_business_analysis(analysis: BusinessAnalysis) -> str:
+    """Goal, actors, functional expectations and constraints grouped by category."""
+    constraints = {}
+    for constraint in analysis.constraints:
+        constraints.setdefault(constraint.category.strip().title(), []).append(constraint.description)
+    
+    lines = [
+        "### Core Business Goal", "", analysis.business_goal, "",
+        "### Key Actors/Users", "", _bullets(analysis.actors), "",
+        "### Functional Expectations", "",
+        "\n".join(f"{i}. {item}" for i, item in enumerate(analysis.functional_expectations, start=1)) or "- None identified",
+        "",
+        "### Non-Functional Constraints", "",
+    ]
+    if constraints:
+        lines += [f"- **{category}:** {'; '.join(descriptions)}" for category, descriptions in constraints.items()]
+    else:
+        lines.append("- None identified")
+    return "\n".join(lines)
+
+
+def render_module_overview(modules: ModuleDecomposition) -> str:
+    """Module table: name, responsibility and tech stack."""
+    return table(
+        ["Module", "Responsibility", "Tech Stack"],
+        [[module.name, module.responsibility, module.tech_stack] for module in modules.modules]
+    )
+
+
+def render_module_dependencies(modules: ModuleDecomposition) -> str:
+    """Dependency table: what each module depends on and what uses it."""
+    used_by = {module.name: [] for module in modules.modules}
+    for module in modules.modules:
+        for dependency in module.dependencies:
+            if dependency in used_by:
+                used_by[dependency].append(module.name)
+    
+    rows = [
+        [module.name, module.dependencies or "None", used_by[module.name] or "None"]
+        for module in modules.modules
+    ]
+    return table(["Module", "Depends On", "Used By"], rows)
+
+
+def render_data_schemas(schemas: DataSchemas) -> str:
+    """One field table per entity, followed by its relationships and indexes."""
+    if not schemas.schemas:
+        return "_No persistent data._"
+    
+    blocks = []
+    for schema in schemas.schemas:
+        lines = [
+            f"#### {schema.entity}",
+            "",
+            table(["Field", "Type", "Constraints"], [[f.name, f.type, f.constraints] for f in schema.fields]),
+        ]
+        if schema.relationships:
+            lines += ["", "**Relationships:**"] + [f"- {r}" for r in schema.relationships]
+        if schema.indexes:
+            lines += ["", "**Indexes:** " + ", ".join(f"`{index}`" for index in schema.indexes)]
+        blocks.append("\n".join(lines))
+    return "\n\n".join(blocks)
+
+
+def render_pseudocode(pseudocode: PseudoCode) -> str:
+    """One sub-section per workflow: description, then the pseudo-code block."""
+    if not pseudocode.sections:
+        return "_No workflows specified._"
+    
+    blocks = []
+    for section in pseudocode.sections:
+        code = section.pseudocode.strip()
+        fence = "~~~" if "```" in code else "```"
+        blocks.append(f"### {section.name}\n\n{section.description}\n\n{fence}\n{code}\n{fence}")
+    return "\n\n".join(blocks)
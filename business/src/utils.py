@@ -15,20 +15,50 @@ def sanitize_filename(title: str) -> str:
     return sanitized
 
 
-def save_report(title: str, markdown_content: str) -> str:
-    """Save the technical specification report to a file."""
+def report_path(title: str, suffix: str = "") -> Path:
+    """Path of a project's specification, creating its folder."""
     # Create output directory if it doesn't exist
     output_dir = Path(Config.OUTPUT_DIR)
     output_dir.mkdir(exist_ok=True)
     
     # Create project-specific folder
     folder_name = sanitize_filename(title)
+    if suffix:
+        folder_name = f"{folder_name}_{sanitize_filename(suffix)}"
     project_dir = output_dir / folder_name
     project_dir.mkdir(exist_ok=True)
     
-    # Save the report
-    report_path = project_dir / "specification.md"
-    with open(report_path, 'w', encoding='utf-8') as f:
-        f.write(markdown_content)
+    return project_dir / "specification.md"
+
+
+class ReportWriter:
+    """Write report parts to the specification file in document order as they complete.
+    
+    Parts can finish in any order; each one is appended (and flushed) as
+    soon as every part before it is on disk.
+    """
+    
+    def __init__(self, title: str, count: int, suffix: str = ""):
+        self.path = report_path(title, suffix)
+        self.parts = [None] * count
+        self._next = 0
+        self._file = open(self.path, 'w', encoding='utf-8')
+    
+    def set(self, index: int, text: str) -> None:
+        self.parts[index] = text
+        while self._next < len(self.parts) and self.parts[self._next] is not None:
+            self._file.write(("\n\n" if self._next else "") + self.parts[self._next])
+            self._file.flush()
+            self._next += 1
+    
+    def close(self) -> str:
+        self._file.write("\n")
+        self._file.close()
+        return "\n\n".join(part for part in self.parts if part is not None) + "\n"
+    
+    def __enter__(self):
+        return self
     
-    return str(report_path)
\ No newline at end of file
+    def __exit__(self, *exc):
+        if not self._file.closed:
+            self._file.close()
\ No newline at end of file
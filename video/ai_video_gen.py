@@ -22,9 +22,6 @@ import feedparser
 import textwrap
 from typing import List, TypedDict
 
-import torch
-from diffusers import DiffusionPipeline
-
 from moviepy.editor import (
     ImageClip,
     CompositeVideoClip,
@@ -40,17 +37,235 @@ os.environ["OPENAI_API_KEY"] = "sk-proj..."
 
 client = OpenAI()
 
-pipe = DiffusionPipeline.from_pretrained(
-    "stabilityai/stable-diffusion-xl-base-1.0",
-    torch_dtype=torch.float16,
-    use_safetensors=True,
-    variant="fp16"
-)
+# ===== IMAGE BACKENDS =====
+# Every backend turns a batch of prompts and per-scene seeds into PIL images.
+# Models load on first use, so nothing heavy happens at import time.
+#   "sdxl"        - SDXL base on the GPU (fp16, 50 steps)
+#   "turbo"       - SDXL-Turbo on the CPU (1 step, 512px)
+#   "tiny"        - TinyPipeline, a seeded few-step conv stand-in on the CPU
+#   "placeholder" - deterministic procedural images, no torch or model needed
+import zlib
+import types
+import random
+import threading
+from PIL import Image as PILImage, ImageDraw
+
+IMAGE_BACKEND = "sdxl"
+IMAGE_BATCH_SIZE = 4  # prompts per generate() call
+BASE_SEED = 1234      # scene i is always generated with seed BASE_SEED + i
+
+class ImageBackend:
+    model_id = ""
+    steps = None
+    size = None
+
+    def generate(self, prompts, seeds):
+        raise NotImplementedError
+
+class PipelineBackend(ImageBackend):
+    def __init__(self, model_id, load, steps=None, size=None, **call_kwargs):
+        self.model_id, self.steps, self.size = model_id, steps, size
+        self.call_kwargs = call_kwargs
+        self._load = load
+        self._pipe = None
+        self._lock = threading.Lock()
+
+    @property
+    def pipe(self):
+        with self._lock:
+            if self._pipe is None:
+                print(f"Loading {self.model_id}...")
+                self._pipe = self._load()
+        return self._pipe
+
+    def generate(self, prompts, seeds):
+        import torch
+
+        kwargs = dict(self.call_kwargs)
+        if self.steps:
+            kwargs["num_inference_steps"] = self.steps
+        if self.size:
+            kwargs["height"] = kwargs["width"] = self.size
+
+        generators = [torch.Generator(device=self.pipe.device).manual_seed(seed) for seed in seeds]
+        return self.pipe(prompt=prompts, generator=generators, **kwargs).images
+
+def load_sdxl():
+    import torch
+    from diffusers import DiffusionPipeline
+
+    pipe = DiffusionPipeline.from_pretrained(
+        "stabilityai/stable-diffusion-xl-base-1.0",
+        torch_dtype=torch.float16,
+        use_safetensors=True,
+        variant="fp16"
+    )
+
+    pipe.to("cuda")
+    return pipe
+
+def load_sdxl_turbo():
+    import torch
+    from diffusers import AutoPipelineForText2Image
+
+    pipe = AutoPipelineForText2Image.from_pretrained(
+        "stabilityai/sdxl-turbo",
+        torch_dtype=torch.float32,
+        use_safetensors=True
+    )
+
+    pipe.to("cpu")
+    return pipe
+
+class TinyPipeline:
+    def __init__(self, size=256, latent_size=32):
+        import torch
+
+        self.device = torch.device("cpu")
+        self.size, self.latent_size = size, latent_size
+        # Fixed weights: 4 latent channels + 1 prompt channel in, 4 latent channels out
+        self.weight = torch.randn(4, 5, 3, 3, generator=torch.Generator().manual_seed(0)) * 0.1
+
+    def __call__(self, prompt, generator=None, num_inference_steps=8, **kwargs):
+        import torch
+
+        prompts = [prompt] if isinstance(prompt, str) else list(prompt)
+        generators = generator if isinstance(generator, list) else [generator] * len(prompts)
+
+        with torch.no_grad():
+            latents = torch.stack([
+                torch.randn((4, self.latent_size, self.latent_size), generator=g)
+                for g in generators
+            ])
+            cond = torch.tensor([zlib.crc32(p.encode()) / 2**32 for p in prompts])
+            cond = cond.view(-1, 1, 1, 1).expand(-1, 1, self.latent_size, self.latent_size)
+
+            for _ in range(num_inference_steps):
+                noise = torch.nn.functional.conv2d(torch.cat([latents, cond], dim=1), self.weight, padding=1)
+                latents = latents - 0.1 * torch.tanh(noise)
+
+            pixels = torch.nn.functional.interpolate(latents[:, :3], size=(self.size, self.size), mode="bilinear")
+            pixels = (torch.sigmoid(pixels) * 255).to(torch.uint8).permute(0, 2, 3, 1).numpy()
+
+        return types.SimpleNamespace(images=[PILImage.fromarray(p) for p in pixels])
+
+class PlaceholderBackend(ImageBackend):
+    model_id = "placeholder"
+
+    def __init__(self, size=1024):
+        self.size = size
+
+    def generate(self, prompts, seeds):
+        return [self.draw(prompt, seed) for prompt, seed in zip(prompts, seeds)]
+
+    def draw(self, prompt, seed):
+        # Same prompt and seed -> same picture: a gradient sky with a few shapes
+        rng = random.Random(f"{seed}:{prompt}")
+        top, bottom = [tuple(rng.randrange(256) for _ in range(3)) for _ in range(2)]
+        mask = PILImage.linear_gradient("L").resize((self.size, self.size))
+        image = PILImage.composite(
+            PILImage.new("RGB", mask.size, bottom),
+            PILImage.new("RGB", mask.size, top),
+            mask
+        )
+
+        draw = ImageDraw.Draw(image)
+        for _ in range(rng.randint(3, 7)):
+            x, y = rng.randrange(self.size), rng.randrange(self.size)
+            r = rng.randint(self.size // 16, self.size // 4)
+            color = tuple(rng.randrange(256) for _ in range(3))
+            shape = draw.ellipse if rng.random() < 0.5 else draw.rectangle
+            shape([x - r, y - r, x + r, y + r], fill=color)
+
+        return image
 
-pipe.to("cuda")
+IMAGE_BACKENDS = {
+    "sdxl": lambda: PipelineBackend("stabilityai/stable-diffusion-xl-base-1.0", load_sdxl, steps=50, size=1024),
+    "turbo": lambda: PipelineBackend("stabilityai/sdxl-turbo", load_sdxl_turbo, steps=1, size=512, guidance_scale=0.0),
+    "tiny": lambda: PipelineBackend("tiny", TinyPipeline, steps=8),
+    "placeholder": PlaceholderBackend,
+}
+
+_backends = {}
+
+def image_backend():
+    if IMAGE_BACKEND not in _backends:
+        _backends[IMAGE_BACKEND] = IMAGE_BACKENDS[IMAGE_BACKEND]()
+    return _backends[IMAGE_BACKEND]
 
 from typing import TypedDict, List
 
+# ===== INSTRUMENTATION =====
+# Per-node wall time, OpenAI token usage and state sizes, printed as a table
+# at the end and appended to metrics.jsonl
+import json
+import time
+import functools
+import threading
+
+METRICS = []
+METRICS_PATH = "metrics.jsonl"
+_metrics_lock = threading.Lock()
+_current_record = None  # nodes run one at a time, so one "current" record is enough
+
+def _payload_size(obj):
+    return len(json.dumps(obj, default=str).encode()) if obj is not None else 0
+
+def instrument(node):
+    @functools.wraps(node)
+    def wrapper(state):
+        global _current_record
+        record = {
+            "node": node.__name__,
+            "wall_time": 0.0,
+            "status": "ok",
+            "retries": 0,
+            "llm_calls": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "input_bytes": _payload_size(state),
+            "output_bytes": 0,
+        }
+        _current_record = record
+        start = time.perf_counter()
+        try:
+            result = node(state)
+            record["output_bytes"] = _payload_size(result)
+            return result
+        except Exception as e:
+            record["status"] = "error"
+            record["error"] = f"{type(e).__name__}: {e}"[:200]
+            raise
+        finally:
+            record["wall_time"] = round(time.perf_counter() - start, 4)
+            _current_record = None
+            METRICS.append(record)
+    return wrapper
+
+def track_usage(response):
+    """Add a chat completion's token usage to the running node's record"""
+    record = _current_record
+    if record is not None and response.usage:
+        with _metrics_lock:
+            record["llm_calls"] += 1
+            record["prompt_tokens"] += response.usage.prompt_tokens
+            record["completion_tokens"] += response.usage.completion_tokens
+    return response
+
+def print_metrics(path=METRICS_PATH):
+    print(f"{'node':<28}{'time s':>8}{'llm':>5}{'tok in':>8}{'tok out':>8}{'KB in':>8}{'KB out':>8}")
+    for m in METRICS:
+        print(
+            f"{m['node']:<28}{m['wall_time']:>8.2f}{m['llm_calls']:>5}{m['prompt_tokens']:>8}"
+            f"{m['completion_tokens']:>8}{m['input_bytes'] / 1024:>8.1f}{m['output_bytes'] / 1024:>8.1f}"
+        )
+    print(f"{'total':<28}{sum(m['wall_time'] for m in METRICS):>8.2f}{sum(m['llm_calls'] for m in METRICS):>5}"
+          f"{sum(m['prompt_tokens'] for m in METRICS):>8}{sum(m['completion_tokens'] for m in METRICS):>8}")
+
+    with open(path, "a") as f:
+        for m in METRICS:
+            f.write(json.dumps(m) + "\n")
+
 class WorkflowState(TypedDict, total=False):
     news: dict
     context: str
@@ -99,10 +314,10 @@ def clean_and_contextualize(state: WorkflowState):
     - Write a concise factual context (max 120 words)
     """
 
-    response = client.chat.completions.create(
+    response = track_usage(client.chat.completions.create(
         model="gpt-4o-mini",
         messages=[{"role": "user", "content": prompt}]
-    )
+    ))
 
     print(f"Cleaned Topic: {response.choices[0].message.content.strip()}\n\n")
 
@@ -130,10 +345,10 @@ def generate_script(state: WorkflowState):
     {context}
     """
 
-    response = client.chat.completions.create(
+    response = track_usage(client.chat.completions.create(
         model="gpt-4o-mini",
         messages=[{"role": "user", "content": prompt}]
-    )
+    ))
 
     script_lines = [
         line.strip("-•0123456789. ").strip()
@@ -148,29 +363,37 @@ def generate_script(state: WorkflowState):
         "script": script_lines
     }
 
-def plan_scenes(state: WorkflowState):
-    scenes = []
+# Per-line LLM calls run concurrently; executor.map keeps them in script order
+from concurrent.futures import ThreadPoolExecutor
 
-    for line in state["script"]:
-        prompt = f"""
-        Convert this narration line into a realistic news image description.
+LLM_MAX_WORKERS = 8
 
-        Line:
-        "{line}"
+def describe_scene(line):
+    prompt = f"""
+    Convert this narration line into a realistic news image description.
 
-        Output:
-        One concise visual description.
-        """
+    Line:
+    "{line}"
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}]
-        )
+    Output:
+    One concise visual description.
+    """
+
+    response = track_usage(client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[{"role": "user", "content": prompt}]
+    ))
+
+    return response.choices[0].message.content.strip()
 
-        scenes.append({
-            "line": line,
-            "visual": response.choices[0].message.content.strip()
-        })
+def plan_scenes(state: WorkflowState):
+    with ThreadPoolExecutor(max_workers=LLM_MAX_WORKERS) as executor:
+        visuals = list(executor.map(describe_scene, state["script"]))
+
+    scenes = [
+        {"line": line, "visual": visual}
+        for line, visual in zip(state["script"], visuals)
+    ]
 
     print(f"Scenes: \n {scenes}\n\n")
 
@@ -179,34 +402,34 @@ def plan_scenes(state: WorkflowState):
         "scenes": scenes
     }
 
-def engineer_prompts(state: WorkflowState):
-    prompts = []
-
-    for scene in state["scenes"]:
-        prompt = f"""
-        Rewrite the following image description into a Stable Diffusion XL prompt
-        that is AT MOST 70 tokens long.
-
-        Rules:
-        - Keep the main subject
-        - Keep the environment
-        - Keep the mood
-        - Remove unnecessary adjectives
-        - No text, no watermark
-        - Photorealistic, cinematic, news photography style
-        - AVOID USING HEAVY TEXT INSIDE IMAGES BECAUSE DIFFUSION MODELS ARE BAD AT GENERATING TEXT INSIDE IMAGES.
-
-        Description:
-        {scene['visual']}
-        """
-
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}]
-        )
+def compress_prompt(visual):
+    prompt = f"""
+    Rewrite the following image description into a Stable Diffusion XL prompt
+    that is AT MOST 70 tokens long.
 
-        compressed_prompt = response.choices[0].message.content.strip()
-        prompts.append(compressed_prompt)
+    Rules:
+    - Keep the main subject
+    - Keep the environment
+    - Keep the mood
+    - Remove unnecessary adjectives
+    - No text, no watermark
+    - Photorealistic, cinematic, news photography style
+    - AVOID USING HEAVY TEXT INSIDE IMAGES BECAUSE DIFFUSION MODELS ARE BAD AT GENERATING TEXT INSIDE IMAGES.
+
+    Description:
+    {visual}
+    """
+
+    response = track_usage(client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[{"role": "user", "content": prompt}]
+    ))
+
+    return response.choices[0].message.content.strip()
+
+def engineer_prompts(state: WorkflowState):
+    with ThreadPoolExecutor(max_workers=LLM_MAX_WORKERS) as executor:
+        prompts = list(executor.map(compress_prompt, [scene["visual"] for scene in state["scenes"]]))
 
     print(f"Prompts: \n {prompts}\n\n")
 
@@ -215,20 +438,199 @@ def engineer_prompts(state: WorkflowState):
         "image_prompts": prompts
     }
 
+# ===== IMAGE CACHE =====
+# Generated images are stored under sha256(prompt, seed, model id, steps, size),
+# so a re-run only pays for scenes whose prompt or settings changed.
+# Least recently used files are evicted above IMAGE_CACHE_MAX_MB.
+import glob
+import shutil
+import hashlib
+
+IMAGE_CACHE_DIR = "image_cache"  # None disables the cache
+IMAGE_CACHE_MAX_MB = 2048
+
+class ImageCache:
+    def __init__(self, root, max_mb):
+        self.root = root
+        self.max_bytes = max_mb * 1024 * 1024
+        self.stats = {"hits": 0, "misses": 0, "stored": 0, "evicted": 0}
+
+    def key(self, backend, prompt, seed):
+        spec = {"prompt": prompt, "seed": seed, "model": backend.model_id, "steps": backend.steps, "size": backend.size}
+        return hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.root, key[:2], f"{key}.png")
+
+    def get(self, key):
+        path = self.path(key)
+        if not os.path.exists(path):
+            self.stats["misses"] += 1
+            return None
+        os.utime(path)  # mark as recently used
+        self.stats["hits"] += 1
+        return path
+
+    def put(self, key, image_path):
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        shutil.copyfile(image_path, path + ".tmp")
+        os.replace(path + ".tmp", path)
+        self.stats["stored"] += 1
+        self.evict()
+
+    def files(self):
+        paths = glob.glob(os.path.join(self.root, "*", "*.png"))
+        return [(os.path.getmtime(p), os.path.getsize(p), p) for p in paths]
+
+    def evict(self):
+        files = sorted(self.files())
+        total = sum(size for _, size, _ in files)
+
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            self.stats["evicted"] += 1
+
+    def report(self):
+        lookups = self.stats["hits"] + self.stats["misses"]
+        size_mb = sum(size for _, size, _ in self.files()) / (1024 * 1024)
+        hit_rate = self.stats["hits"] / lookups if lookups else 0
+        print(
+            f"Image cache: {self.stats['hits']}/{lookups} hits ({hit_rate:.0%}), "
+            f"{self.stats['stored']} stored, {self.stats['evicted']} evicted, "
+            f"{size_mb:.1f}/{self.max_bytes / (1024 * 1024):.0f} MB in {self.root}/"
+        )
+
+image_cache = ImageCache(IMAGE_CACHE_DIR, IMAGE_CACHE_MAX_MB) if IMAGE_CACHE_DIR else None
+
+def scene_seeds(start, count):
+    return [BASE_SEED + start + j for j in range(count)]
+
+def render_batch(start, prompts):
+    backend = image_backend()
+    seeds = scene_seeds(start, len(prompts))
+    paths = [f"scene_{start + j}.png" for j in range(len(prompts))]
+    keys = [image_cache.key(backend, p, s) for p, s in zip(prompts, seeds)] if image_cache else None
+
+    missing = []
+    for j, path in enumerate(paths):
+        cached = image_cache.get(keys[j]) if image_cache else None
+        if cached:
+            shutil.copyfile(cached, path)
+        else:
+            missing.append(j)
+
+    if missing:
+        images = backend.generate([prompts[j] for j in missing], [seeds[j] for j in missing])
+        for j, image in zip(missing, images):
+            image.save(paths[j])
+            if image_cache:
+                image_cache.put(keys[j], paths[j])
+
+    return paths
+
 def generate_images(state: WorkflowState):
+    prompts = state["image_prompts"]
     image_paths = []
 
-    for i, prompt in enumerate(state["image_prompts"]):
-        image = pipe(prompt=prompt).images[0]
-        path = f"scene_{i}.png"
-        image.save(path)
-        image_paths.append(path)
+    for start in range(0, len(prompts), IMAGE_BATCH_SIZE):
+        image_paths += render_batch(start, prompts[start:start + IMAGE_BATCH_SIZE])
 
     return {
         **state,
         "images": image_paths
     }
 
+# ===== BATCH SIZE BENCHMARK =====
+RUN_IMAGE_BENCHMARK = False
+
+def benchmark_batch_sizes(batch_sizes=(1, 2, 4, 8), n_images=8, prompt="city skyline at dusk, news photography"):
+    backend = image_backend()
+    print(f"Backend: {IMAGE_BACKEND} ({backend.model_id})")
+    print(f"{'batch':>6}{'s/image':>10}{'images/s':>10}")
+
+    for size in batch_sizes:
+        backend.generate([prompt] * size, scene_seeds(0, size))  # warm-up
+        start = time.perf_counter()
+
+        for first in range(0, n_images, size):
+            count = min(size, n_images - first)
+            backend.generate([prompt] * count, scene_seeds(first, count))
+
+        elapsed = time.perf_counter() - start
+        print(f"{size:>6}{elapsed / n_images:>10.3f}{n_images / elapsed:>10.2f}")
+
+if RUN_IMAGE_BENCHMARK:
+    benchmark_batch_sizes()
+
+# ===== PIPELINED STORYBOARD =====
+# scenes -> prompts -> images as one stage: every line is planned in the thread
+# pool while images render in script order, a batch at a time as soon as
+# IMAGE_BATCH_SIZE prompts are ready, instead of after all 16 LLM calls.
+PIPELINE_SCENES = True
+FUSED_SCENE_PROMPTS = False  # True: one LLM call per line for both the visual and the SDXL prompt
+
+def describe_and_compress(line):
+    prompt = f"""
+    Turn this news narration line into an image for the video.
+
+    Line:
+    "{line}"
+
+    Return a JSON object with:
+    - "visual": one concise, realistic news image description
+    - "prompt": that description as a Stable Diffusion XL prompt of AT MOST 70 tokens:
+      keep the main subject, environment and mood, remove unnecessary adjectives,
+      no text, no watermark, photorealistic, cinematic, news photography style.
+      AVOID TEXT INSIDE THE IMAGE BECAUSE DIFFUSION MODELS ARE BAD AT GENERATING TEXT.
+    """
+
+    response = track_usage(client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[{"role": "user", "content": prompt}],
+        response_format={"type": "json_object"}
+    ))
+
+    scene = json.loads(response.choices[0].message.content)
+    return scene["visual"].strip(), scene["prompt"].strip()
+
+def plan_line(line):
+    if FUSED_SCENE_PROMPTS:
+        return describe_and_compress(line)
+    visual = describe_scene(line)
+    return visual, compress_prompt(visual)
+
+def storyboard(state: WorkflowState):
+    scenes, prompts, image_paths = [], [], []
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=LLM_MAX_WORKERS) as executor:
+        planned = [executor.submit(plan_line, line) for line in state["script"]]
+
+        for i, (line, future) in enumerate(zip(state["script"], planned)):
+            visual, prompt = future.result()
+            scenes.append({"line": line, "visual": visual})
+            prompts.append(prompt)
+
+            if len(prompts) - len(image_paths) == IMAGE_BATCH_SIZE or i == len(planned) - 1:
+                first_batch = not image_paths
+                image_paths += render_batch(len(image_paths), prompts[len(image_paths):])
+
+                if first_batch:
+                    print(f"First images after {time.perf_counter() - start:.1f}s")
+
+    print(f"Prompts: \n {prompts}\n\n")
+
+    return {
+        **state,
+        "scenes": scenes,
+        "image_prompts": prompts,
+        "images": image_paths
+    }
+
 from PIL import Image as PILImage, ImageDraw, ImageFont
 import textwrap
 
@@ -337,22 +739,28 @@ def compose_video(state: WorkflowState):
 
 graph = StateGraph(WorkflowState)
 
-graph.add_node("fetch", fetch_trending_news)
-graph.add_node("clean", clean_and_contextualize)
-graph.add_node("script", generate_script)
-graph.add_node("scenes", plan_scenes)
-graph.add_node("prompts", engineer_prompts)
-graph.add_node("images", generate_images)
-graph.add_node("video", compose_video)
+graph.add_node("fetch", instrument(fetch_trending_news))
+graph.add_node("clean", instrument(clean_and_contextualize))
+graph.add_node("script", instrument(generate_script))
+graph.add_node("video", instrument(compose_video))
 
 graph.set_entry_point("fetch")
 
 graph.add_edge("fetch", "clean")
 graph.add_edge("clean", "script")
-graph.add_edge("script", "scenes")
-graph.add_edge("scenes", "prompts")
-graph.add_edge("prompts", "images")
-graph.add_edge("images", "video")
+
+if PIPELINE_SCENES:
+    graph.add_node("storyboard", instrument(storyboard))
+    graph.add_edge("script", "storyboard")
+    graph.add_edge("storyboard", "video")
+else:
+    graph.add_node("scenes", instrument(plan_scenes))
+    graph.add_node("prompts", instrument(engineer_prompts))
+    graph.add_node("images", instrument(generate_images))
+    graph.add_edge("script", "scenes")
+    graph.add_edge("scenes", "prompts")
+    graph.add_edge("prompts", "images")
+    graph.add_edge("images", "video")
 
 app = graph.compile()
 
@@ -360,4 +768,7 @@ from IPython.display import Image, display
 display(Image(app.get_graph().draw_mermaid_png()))
 
 final_state = app.invoke({})
+print_metrics()
+if image_cache:
+    image_cache.report()
 final_state["video"]